@@ -4,8 +4,6 @@ Basic usage example for MCP-Ghost
 """
 import asyncio
 import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from mcp_ghost import mcp_ghost, MCPGhostConfig
 
@@ -4,8 +4,6 @@ Multi-provider comparison example for MCP-Ghost
 """
 import asyncio
 import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from mcp_ghost import mcp_ghost, MCPGhostConfig
 
@@ -76,19 +74,30 @@ async def main():
     
     results = []
     
+    # Report skipped providers up front so output ordering stays deterministic
+    active_providers = []
     for provider_config in providers:
         if provider_config["api_key"]:
-            result = await test_provider(
-                provider_config["name"],
-                provider_config["model"], 
-                provider_config["api_key"],
-                user_prompt
-            )
-            if result:
-                results.append((provider_config["name"], result))
+            active_providers.append(provider_config)
         else:
             print(f"\n⚠️  Skipping {provider_config['name']} - no API key found")
     
+    # Each run is network-bound, so dispatch them concurrently and handle
+    # results as they finish rather than waiting on the slowest provider
+    async def run_provider(provider_config):
+        result = await test_provider(
+            provider_config["name"],
+            provider_config["model"],
+            provider_config["api_key"],
+            user_prompt
+        )
+        return provider_config["name"], result
+    
+    for next_done in asyncio.as_completed([run_provider(p) for p in active_providers]):
+        provider_name, result = await next_done
+        if result:
+            results.append((provider_name, result))
+    
     # Compare results
     if len(results) > 1:
         print(f"\n📊 Comparison of {len(results)} providers:")
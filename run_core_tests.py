@@ -11,10 +11,12 @@ This script runs the essential functionality tests while skipping:
 This ensures fast, reliable testing without external dependencies.
 """
 
-import subprocess
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 def main():
     """Run core tests and return exit code."""
     test_paths = [
@@ -26,8 +28,7 @@ def main():
         "tests/providers/test_client_factory.py",  # Factory tests are solid
     ]
     
-    cmd = [
-        "pytest",
+    args = [
         "--tb=short",
         "-v",
         *test_paths
@@ -35,20 +36,22 @@ def main():
     
     print("Running core MCP-Ghost functionality tests...")
     print("Skipping: provider API tests, E2E tests, tests requiring external dependencies")
-    print("Command:", " ".join(cmd))
+    print("Command: pytest", " ".join(args))
     print()
     
-    result = subprocess.run(cmd, cwd=Path(__file__).parent)
+    # Run in-process rather than spawning a fresh interpreter
+    os.chdir(Path(__file__).parent)
+    returncode = int(pytest.main(args))
     
-    if result.returncode == 0:
+    if returncode == 0:
         print("\n✅ All core functionality tests passed!")
         print("Core components working: config, tools, utils, client factory")
         print("\nFor full test suite (with external dependencies): make test-all")
     else:
-        print(f"\n❌ Some tests failed (exit code: {result.returncode})")
+        print(f"\n❌ Some tests failed (exit code: {returncode})")
         print("This indicates issues with core functionality, not external dependencies.")
     
-    return result.returncode
+    return returncode
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -1,28 +1,25 @@
 #!/usr/bin/env python
 """Test runner for MCP-Ghost."""
+import os
 import sys
-import subprocess
 from pathlib import Path
 
 def run_tests():
-    """Run the test suite."""
-    # Add src to path for imports
-    src_path = Path(__file__).parent / "src"
-    sys.path.insert(0, str(src_path))
-    
-    # Run pytest with coverage if available
+    """Run the test suite (expects the package installed with `make install-dev`)."""
     try:
-        result = subprocess.run([
-            sys.executable, "-m", "pytest", 
-            "tests/",
-            "-v",
-            "--tb=short",
-            "-m", "not slow"  # Skip slow tests by default
-        ], cwd=Path(__file__).parent)
-        return result.returncode
-    except FileNotFoundError:
+        import pytest
+    except ImportError:
         print("pytest not found. Install with: pip install pytest")
         return 1
+    
+    # Run pytest in-process, skipping slow tests by default
+    os.chdir(Path(__file__).parent)
+    return int(pytest.main([
+        "tests/",
+        "-v",
+        "--tb=short",
+        "-m", "not slow"
+    ]))
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_tests())
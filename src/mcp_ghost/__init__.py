@@ -4,7 +4,16 @@ MCP-Ghost: Intelligent MCP tool orchestration library
 Provides Claude Desktop-level tool orchestration capabilities for MCP servers.
 """
 
-from .core import mcp_ghost, MCPGhostConfig, MCPGhostResult
-
 __version__ = "0.1.0"
-__all__ = ["mcp_ghost", "MCPGhostConfig", "MCPGhostResult"]
\ No newline at end of file
+__all__ = ["mcp_ghost", "mcp_ghost_stream", "MCPGhostConfig", "MCPGhostResult"]
+
+
+def __getattr__(name):
+    # Import core (and with it the MCP and provider SDKs) on first use, so
+    # importing a light submodule such as mcp_ghost.tools stays cheap
+    if name in __all__:
+        from . import core
+        value = getattr(core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
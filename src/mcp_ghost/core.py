@@ -6,22 +6,51 @@ Provides intelligent multi-step MCP tool operations via LLM with Claude Desktop-
 from __future__ import annotations
 
 import asyncio
+import atexit
+import copy
+import hashlib
 import json
 import logging
 import os
+from collections import OrderedDict
 from pathlib import Path
 import time
 import uuid
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Protocol, Tuple, Union
 from datetime import datetime
 
+# Optional speedups for response-cache keying
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPGhostConfig:
-    """Configuration for MCP-Ghost execution."""
+    """
+    Configuration for MCP-Ghost execution.
+    
+    Instances are immutable (derive variants with ``dataclasses.replace``) and
+    hash by a content digest computed once at construction, so a config can be
+    used directly as a dict key. Don't mutate ``server_config`` in place.
+    """
     server_config: Union[Dict[str, Any], str, Path]
     system_prompt: str
     provider: str  # "openai", "anthropic", "gemini"
@@ -33,11 +62,40 @@ class MCPGhostConfig:
     max_iterations: int = 10
     enable_backtracking: bool = True
     conversation_memory: bool = True
+    temperature: float = 0.0  # sampling temperature sent to the provider; 0 also enables caching
+    content_digest: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Process server_config if it's a file path."""
+        """Process server_config if it's a file path and precompute the content digest."""
         if isinstance(self.server_config, (str, Path)):
-            self.server_config = self._load_server_config(self.server_config)
+            object.__setattr__(self, "server_config", self._load_server_config(self.server_config))
+        object.__setattr__(self, "content_digest", self._compute_digest())
+    
+    def __hash__(self) -> int:
+        return hash(self.content_digest)
+    
+    def _compute_digest(self) -> str:
+        """Non-cryptographic 128-bit digest of the request-defining fields."""
+        key_fields = {
+            "provider": self.provider,
+            "model": self.model,
+            "system_prompt": self.system_prompt,
+            "user_prompt": self.user_prompt,
+            "server_config": self.server_config,
+            "namespace": self.namespace,
+        }
+        if orjson is not None:
+            payload = orjson.dumps(
+                key_fields,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+        else:
+            payload = json.dumps(key_fields, sort_keys=True, default=str).encode("utf-8")
+        
+        if blake3 is not None:
+            return blake3.blake3(payload).hexdigest(16)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
     
     def _load_server_config(self, config_path: Union[str, Path]) -> Dict[str, Any]:
         """Load MCP server configuration from a file.
@@ -71,7 +129,7 @@ class MCPGhostConfig:
         return config_data
 
 
-@dataclass 
+@dataclass(slots=True)
 class ToolCallInfo:
     """Information about a single tool call."""
     iteration: int
@@ -85,7 +143,7 @@ class ToolCallInfo:
     retry_attempt: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPGhostResult:
     """Result from MCP-Ghost execution."""
     success: bool
@@ -97,13 +155,115 @@ class MCPGhostResult:
     execution_metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class TokenUsage:
+    """Token counters accumulated in place across LLM calls."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    
+    def add(self, usage: Dict[str, Any]) -> None:
+        """Add one provider-reported ``usage`` dict to the running totals."""
+        self.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+        self.completion_tokens += usage.get("completion_tokens", 0) or 0
+        self.total_tokens += usage.get("total_tokens", 0) or 0
+        self.cache_creation_input_tokens += usage.get("cache_creation_input_tokens", 0) or 0
+        self.cache_read_input_tokens += usage.get("cache_read_input_tokens", 0) or 0
+
+
+class CacheBackend(Protocol):
+    """Storage interface for the mcp_ghost response cache."""
+
+    async def get(self, key: str) -> Optional[MCPGhostResult]:
+        ...
+
+    async def set(self, key: str, value: MCPGhostResult) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache backend with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, MCPGhostResult]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[MCPGhostResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: MCPGhostResult) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class _LLMCache:
+    """
+    Response cache for repeated, deterministic mcp_ghost invocations.
+
+    Only stateless configs (``conversation_memory=False``) sampled at
+    ``temperature == 0`` are cached; everything else always runs live.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend: CacheBackend = backend or MemoryCacheBackend()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def is_cacheable(config: MCPGhostConfig) -> bool:
+        return not config.conversation_memory and config.temperature == 0
+
+    @staticmethod
+    def cache_key(config: MCPGhostConfig) -> str:
+        """Content digest of the request-defining fields (precomputed on the config)."""
+        return config.content_digest
+
+    async def get(self, key: str) -> Optional[MCPGhostResult]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: MCPGhostResult) -> None:
+        await self.backend.set(key, copy.deepcopy(value))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self.stats = {"hits": 0, "misses": 0}
+
+
+_cache = _LLMCache()
+
+
 # MCP imports - using official MCP Python SDK
 try:
     from mcp import ClientSession, StdioServerParameters, stdio_client
     MCP_AVAILABLE = True
-except ImportError:
+    _MCP_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
     # Define placeholder for testing when MCP isn't available
     MCP_AVAILABLE = False
+    _MCP_IMPORT_ERROR = e
     class ClientSession:
         pass
     class StdioServerParameters:
@@ -116,6 +276,47 @@ from .providers.client_factory import get_llm_client
 from .utils.prompt_generator import SystemPromptGenerator
 from .tools.adapter import ToolNameAdapter
 from .tools.formatter import format_tool_response
+from .utils import json_utils
+
+# Stateless after construction, so build it once rather than per call
+_prompt_generator = SystemPromptGenerator()
+
+# Provider clients keyed by (provider, model, api_key). The SDK clients keep
+# their HTTP connection pools alive, so reusing them across mcp_ghost calls
+# avoids a fresh TCP+TLS handshake per invocation.
+_client_pool: Dict[Tuple[str, Optional[str], str], Any] = {}
+
+
+def _get_pooled_client(config: MCPGhostConfig) -> Any:
+    """Return the shared LLM client for this config, creating it on first use.
+
+    No lock is needed: construction is synchronous, so no other task can
+    interleave between the lookup and the insert.
+    """
+    key = (config.provider.lower(), config.model, config.api_key)
+    client = _client_pool.get(key)
+    if client is None:
+        client = get_llm_client(
+            provider=config.provider,
+            model=config.model,
+            api_key=config.api_key
+        )
+        _client_pool[key] = client
+    return client
+
+
+@atexit.register
+def _close_client_pool() -> None:
+    """Close pooled SDK clients so their connections are released cleanly."""
+    for client in _client_pool.values():
+        sdk_client = getattr(client, "client", None)
+        close = getattr(sdk_client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+    _client_pool.clear()
 
 
 async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
@@ -130,6 +331,70 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
     Returns:
         MCPGhostResult with execution details
     """
+    cache_key = None
+    if _cache.is_cacheable(config):
+        cache_key = _cache.cache_key(config)
+        cached = await _cache.get(cache_key)
+        if cached is not None:
+            cached.execution_metadata["cache"] = dict(_cache.stats)
+            return cached
+    
+    result = await _run_mcp_ghost(config)
+    
+    # ``success`` stays True for recovered errors under backtracking, so
+    # check ``errors`` to keep failed runs out of the cache
+    if cache_key is not None and not result.errors:
+        await _cache.set(cache_key, result)
+    result.execution_metadata["cache"] = dict(_cache.stats)
+    return result
+
+
+async def mcp_ghost_stream(config: MCPGhostConfig) -> AsyncIterator[str]:
+    """
+    Execute like :func:`mcp_ghost`, yielding the LLM's text as it is generated.
+    
+    Text from every iteration is streamed, including any commentary emitted
+    alongside tool calls; tool calls themselves run as usual. Streaming runs
+    are never served from or stored in the response cache.
+    
+    Args:
+        config: MCPGhostConfig instance (server_config can be dict or file path)
+        
+    Yields:
+        Text deltas in the order the provider produced them
+        
+    Raises:
+        RuntimeError: If the run failed (as :attr:`MCPGhostResult.success` would
+            report), once streaming has finished
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def _run() -> MCPGhostResult:
+        try:
+            return await _run_mcp_ghost(config, on_text=queue.put_nowait)
+        finally:
+            queue.put_nowait(None)
+    
+    task = asyncio.create_task(_run())
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        result = await task
+        if not result.success:
+            raise RuntimeError("; ".join(error["error"] for error in result.errors))
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+async def _run_mcp_ghost(
+    config: MCPGhostConfig,
+    on_text: Optional[Callable[[str], None]] = None
+) -> MCPGhostResult:
+    """Run a single uncached mcp_ghost execution, streaming text to *on_text* if given."""
     start_time = time.time()
     
     conversation_history = []
@@ -138,6 +403,8 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
     iteration = 0
     available_tools = []
     connected_servers = 0
+    token_usage = TokenUsage()
+    usage_reported = False
     
     try:
         # Validate configuration
@@ -145,40 +412,40 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
             raise ValueError("API key is required")
         
         if not MCP_AVAILABLE:
-            logger.warning("MCP SDK not available, falling back to placeholder mode")
+            logger.warning(f"MCP SDK not available ({_MCP_IMPORT_ERROR}), falling back to placeholder mode")
             return _create_placeholder_result(config, start_time)
         
         # Connect to MCP servers and discover tools
         if config.server_config and "mcpServers" in config.server_config:
-            for server_name, server_config in config.server_config["mcpServers"].items():
-                try:
-                    tools = await _connect_to_mcp_server(server_name, server_config)
-                    available_tools.extend(tools)
-                    connected_servers += 1
-                    logger.info(f"Connected to MCP server '{server_name}', found {len(tools)} tools")
-                except Exception as e:
-                    logger.error(f"Failed to connect to MCP server '{server_name}': {e}")
+            # Spawn and handshake all servers concurrently
+            server_specs = list(config.server_config["mcpServers"].items())
+            discovered = await asyncio.gather(
+                *(_connect_to_mcp_server(server_name, server_config)
+                  for server_name, server_config in server_specs),
+                return_exceptions=True
+            )
+            for (server_name, _), tools in zip(server_specs, discovered):
+                if isinstance(tools, Exception):
+                    logger.error(f"Failed to connect to MCP server '{server_name}': {tools}")
                     errors.append({
                         "iteration": 0,
                         "tool_name": "mcp_connection",
-                        "error": f"Failed to connect to server {server_name}: {str(e)}",
+                        "error": f"Failed to connect to server {server_name}: {str(tools)}",
                         "recovery_action": "Continuing with other servers"
                     })
+                    continue
+                available_tools.extend(tools)
+                connected_servers += 1
+                logger.info(f"Connected to MCP server '{server_name}', found {len(tools)} tools")
         
-        # Get LLM client
-        llm_client = get_llm_client(
-            provider=config.provider,
-            model=config.model,
-            api_key=config.api_key
-        )
+        # Get (shared) LLM client
+        llm_client = _get_pooled_client(config)
         
         # Adapt tool names for the specific provider
-        tool_adapter = ToolNameAdapter()
-        adapted_tools = tool_adapter.adapt_tools(available_tools, config.namespace, config.provider)
+        adapted_tools = ToolNameAdapter.adapt_tools(available_tools, config.namespace, config.provider)
         
         # Generate system prompt with available tools
-        prompt_generator = SystemPromptGenerator()
-        system_prompt = prompt_generator.generate(
+        system_prompt = _prompt_generator.generate(
             tools=adapted_tools,
             namespace=config.namespace,
             additional_context=config.system_prompt
@@ -197,11 +464,20 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
             
             try:
                 # Create completion with available tools
-                completion_result = await llm_client.create_completion(
+                completion_result = await _create_completion(
+                    llm_client,
+                    config.provider,
+                    on_text=on_text,
                     messages=conversation_history,
-                    tools=adapted_tools if adapted_tools else None
+                    tools=adapted_tools if adapted_tools else None,
+                    temperature=config.temperature
                 )
                 
+                usage = completion_result.get("usage")
+                if usage:
+                    usage_reported = True
+                    token_usage.add(usage)
+                
                 # Add assistant response to conversation
                 assistant_message = {
                     "role": "assistant",
@@ -222,15 +498,20 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
                 tool_results = []
                 for tool_call in completion_result["tool_calls"]:
                     tool_start_time = time.time()
+                    raw_arguments = tool_call["function"]["arguments"]
+                    arguments: Dict[str, Any] = {}
                     
                     try:
+                        # Parse arguments once and reuse them for execution and reporting
+                        arguments = json_utils.loads(raw_arguments) if raw_arguments else {}
+                        
                         # Execute the tool call
-                        result = await _execute_tool_call(tool_call, available_tools, config.namespace)
+                        result = await _execute_tool_call(tool_call, available_tools, config.namespace, arguments)
                         
                         tool_info = ToolCallInfo(
                             iteration=iteration,
                             tool_name=tool_call["function"]["name"],
-                            arguments=json.loads(tool_call["function"]["arguments"]) if tool_call["function"]["arguments"] else {},
+                            arguments=arguments,
                             success=True,
                             result=result,
                             execution_time=time.time() - tool_start_time,
@@ -251,7 +532,7 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
                         tool_info = ToolCallInfo(
                             iteration=iteration,
                             tool_name=tool_call["function"]["name"],
-                            arguments=json.loads(tool_call["function"]["arguments"]) if tool_call["function"]["arguments"] else {},
+                            arguments=arguments,
                             success=False,
                             error=str(e),
                             execution_time=time.time() - tool_start_time,
@@ -303,6 +584,12 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
         
         summary = f"Completed {iteration} iterations with {successful_tools}/{total_tools} successful tool calls using {config.provider}"
         
+        if not usage_reported:
+            # Provider didn't report usage; fall back to a rough estimate
+            token_usage.prompt_tokens = iteration * 100
+            token_usage.completion_tokens = iteration * 50
+            token_usage.total_tokens = iteration * 150
+        
         return MCPGhostResult(
             success=len(errors) == 0 or config.enable_backtracking,
             final_result=final_result,
@@ -317,11 +604,7 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
                 "servers_connected": connected_servers,
                 "backtrack_count": len([e for e in errors if "recovery_action" in e]),
                 "success_rate": success_rate,
-                "token_usage": {  # TODO: aggregate from LLM calls
-                    "prompt_tokens": iteration * 100,  # Rough estimate
-                    "completion_tokens": iteration * 50,
-                    "total_tokens": iteration * 150
-                }
+                "token_usage": asdict(token_usage)
             }
         )
         
@@ -347,15 +630,155 @@ async def mcp_ghost(config: MCPGhostConfig) -> MCPGhostResult:
                 "servers_connected": connected_servers,
                 "backtrack_count": len([e for e in errors if "recovery_action" in e]),
                 "success_rate": 0.0,
-                "token_usage": {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0
-                }
+                "token_usage": asdict(token_usage)
             }
         )
 
 
+# Max in-flight LLM requests per provider, to stay under provider rate limits
+_PROVIDER_CONCURRENCY = {"openai": 5, "anthropic": 3, "gemini": 5}
+_DEFAULT_CONCURRENCY = 5
+_RATE_LIMIT_ATTEMPTS = 5
+
+# Semaphores bind to the event loop they're first awaited on, so keep one set per loop
+_provider_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Return the concurrency limiter for *provider* on the running loop."""
+    provider = provider.lower()
+    per_loop = _provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(provider)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_PROVIDER_CONCURRENCY.get(provider, _DEFAULT_CONCURRENCY))
+        per_loop[provider] = semaphore
+    return semaphore
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """True for HTTP 429 errors from any of the provider SDKs."""
+    return getattr(exc, "status_code", None) == 429 or getattr(exc, "code", None) == 429
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Extract the ``retry-after`` header (in seconds) from a rate-limit error."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _wait_for_rate_limit(retry_state) -> float:
+    """Honour the server's retry-after hint, else back off exponentially."""
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    return retry_after if retry_after is not None else _backoff(retry_state)
+
+
+async def _create_completion(
+    llm_client: Any,
+    provider: str,
+    on_text: Optional[Callable[[str], None]] = None,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Call the LLM with bounded per-provider concurrency, retrying on 429s.
+    
+    The semaphore is released while backing off, so a throttled request
+    doesn't hold a slot other requests could use. When *on_text* is given
+    the completion is streamed and each text delta is passed to it; once
+    text has been passed on, errors are no longer retried, since a retry
+    would replay the reply from the start.
+    """
+    emitted = False
+    
+    def _emit(text: str) -> None:
+        nonlocal emitted
+        emitted = True
+        on_text(text)
+    
+    def _should_retry(exc: BaseException) -> bool:
+        return not emitted and _is_rate_limit_error(exc)
+    
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(_should_retry),
+        wait=_wait_for_rate_limit,
+        stop=stop_after_attempt(_RATE_LIMIT_ATTEMPTS),
+        reraise=True,
+    ):
+        with attempt:
+            async with _provider_semaphore(provider):
+                if on_text is not None:
+                    return await _stream_completion(llm_client, _emit, **kwargs)
+                return await llm_client.create_completion(**kwargs)
+
+
+def _field(obj: Any, key: str) -> Any:
+    """Read *key* from a dict or an SDK object."""
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _merge_tool_call_deltas(calls: List[Dict[str, Any]], by_index: Dict[Any, Dict[str, Any]], deltas: List[Any]) -> None:
+    """
+    Fold streamed tool-call fragments into complete tool calls.
+    
+    Fragments sharing an ``index`` (OpenAI, Claude) are concatenated;
+    fragments without one (Gemini sends whole calls) are appended as-is.
+    """
+    for delta in deltas or []:
+        index = _field(delta, "index")
+        call = by_index.get(index) if index is not None else None
+        if call is None:
+            call = {"id": None, "type": "function", "function": {"name": "", "arguments": ""}}
+            calls.append(call)
+            if index is not None:
+                by_index[index] = call
+        
+        if _field(delta, "id"):
+            call["id"] = _field(delta, "id")
+        function = _field(delta, "function")
+        if function is not None:
+            call["function"]["name"] += _field(function, "name") or ""
+            arguments = _field(function, "arguments")
+            if isinstance(arguments, dict):
+                arguments = json_utils.dumps(arguments)
+            call["function"]["arguments"] += arguments or ""
+    
+    for call in calls:
+        if not call["id"]:
+            call["id"] = f"call_{uuid.uuid4().hex[:8]}"
+
+
+async def _stream_completion(
+    llm_client: Any,
+    on_text: Callable[[str], None],
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """Stream a completion, forwarding text deltas and assembling the full result."""
+    parts: List[str] = []
+    calls: List[Dict[str, Any]] = []
+    by_index: Dict[Any, Dict[str, Any]] = {}
+    
+    stream = await llm_client.create_completion(stream=True, **kwargs)
+    async for chunk in stream:
+        text = chunk.get("response")
+        if text:
+            parts.append(text)
+            on_text(text)
+        _merge_tool_call_deltas(calls, by_index, chunk.get("tool_calls"))
+    
+    response = "".join(parts)
+    return {"response": response or (None if calls else ""), "tool_calls": calls}
+
+
 async def _connect_to_mcp_server(server_name: str, server_config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Connect to an MCP server and discover available tools.
@@ -401,7 +824,12 @@ async def _connect_to_mcp_server(server_name: str, server_config: Dict[str, Any]
         raise
 
 
-async def _execute_tool_call(tool_call: Dict[str, Any], available_tools: List[Dict[str, Any]], namespace: str) -> Any:
+async def _execute_tool_call(
+    tool_call: Dict[str, Any],
+    available_tools: List[Dict[str, Any]],
+    namespace: str,
+    arguments: Optional[Dict[str, Any]] = None
+) -> Any:
     """
     Execute a single tool call.
     
@@ -409,12 +837,15 @@ async def _execute_tool_call(tool_call: Dict[str, Any], available_tools: List[Di
         tool_call: The tool call to execute
         available_tools: List of available tools
         namespace: Tool namespace
+        arguments: Already-parsed arguments (parsed from tool_call if None)
         
     Returns:
         The result of the tool execution
     """
     tool_name = tool_call["function"]["name"]
-    arguments = json.loads(tool_call["function"]["arguments"]) if tool_call["function"]["arguments"] else {}
+    if arguments is None:
+        raw_arguments = tool_call["function"]["arguments"]
+        arguments = json_utils.loads(raw_arguments) if raw_arguments else {}
     
     # Remove namespace prefix if present
     if tool_name.startswith(f"{namespace}_"):
@@ -465,10 +896,10 @@ def _create_placeholder_result(config: MCPGhostConfig, start_time: float) -> MCP
             "servers_connected": 0,
             "backtrack_count": 0,
             "success_rate": 1.0,
-            "token_usage": {
-                "prompt_tokens": 50,
-                "completion_tokens": 25,
-                "total_tokens": 75
-            }
+            "token_usage": asdict(TokenUsage(
+                prompt_tokens=50,
+                completion_tokens=25,
+                total_tokens=75
+            ))
         }
     )
\ No newline at end of file
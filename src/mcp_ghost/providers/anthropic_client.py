@@ -9,7 +9,8 @@ Anthropic chat-completion adapter for MCP-Ghost (Claude 3 family).
     • assistant tool-calls  → `tool_use` blocks
     • tool results          → `tool_result` blocks
   so loops are avoided.
-* Streams via the shared OpenAIStyleMixin helper.
+* Streams Claude's event stream as MCP-style deltas (text deltas, plus
+  OpenAI-style indexed tool-call fragments).
 * DEBUG logging honours the LOGLEVEL env-var.
 
 Fixes
@@ -17,10 +18,14 @@ Fixes
 * `tools` is always a list (never `null`).
 * **NEW** 2025-05-14 – omit the `"system"` key entirely when there is no system
   prompt, preventing `system: Input should be a valid list` 400 errors.
+* The system prompt is sent as a single text block marked
+  `cache_control: ephemeral`, so repeated turns read the (large, static)
+  prompt + tool prefix from Anthropic's prompt cache.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -42,7 +47,26 @@ def _safe_get(obj: Any, key: str, default: Any = None) -> Any:
     return obj.get(key, default) if isinstance(obj, dict) else getattr(obj, key, default)
 
 
+def _parse_claude_usage(resp) -> Dict[str, int]:
+    usage = getattr(resp, "usage", None)
+
+    def _count(key: str) -> int:
+        value = _safe_get(usage, key, 0)
+        return value if isinstance(value, int) else 0
+
+    prompt_tokens = _count("input_tokens")
+    completion_tokens = _count("output_tokens")
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "cache_creation_input_tokens": _count("cache_creation_input_tokens"),
+        "cache_read_input_tokens": _count("cache_read_input_tokens"),
+    }
+
+
 def _parse_claude_response(resp) -> Dict[str, Any]:
+    usage = _parse_claude_usage(resp)
     tool_calls: List[Dict[str, Any]] = []
     for blk in getattr(resp, "content", []):
         if _safe_get(blk, "type") != "tool_use":
@@ -59,10 +83,49 @@ def _parse_claude_response(resp) -> Dict[str, Any]:
         )
 
     if tool_calls:
-        return {"response": None, "tool_calls": tool_calls}
+        return {"response": None, "tool_calls": tool_calls, "usage": usage}
 
     text = resp.content[0].text if getattr(resp, "content", None) else ""
-    return {"response": text, "tool_calls": []}
+    return {"response": text, "tool_calls": [], "usage": usage}
+
+
+def _parse_claude_stream_event(event) -> Optional[Dict[str, Any]]:
+    """Convert one streaming event → MCP delta dict (None for bookkeeping events)."""
+    etype = _safe_get(event, "type")
+
+    if etype == "content_block_start":
+        block = _safe_get(event, "content_block")
+        if _safe_get(block, "type") != "tool_use":
+            return None
+        return {
+            "response": "",
+            "tool_calls": [
+                {
+                    "index": _safe_get(event, "index"),
+                    "id": _safe_get(block, "id"),
+                    "type": "function",
+                    "function": {"name": _safe_get(block, "name"), "arguments": ""},
+                }
+            ],
+        }
+
+    if etype == "content_block_delta":
+        delta = _safe_get(event, "delta")
+        dtype = _safe_get(delta, "type")
+        if dtype == "text_delta":
+            return {"response": _safe_get(delta, "text", ""), "tool_calls": []}
+        if dtype == "input_json_delta":
+            return {
+                "response": "",
+                "tool_calls": [
+                    {
+                        "index": _safe_get(event, "index"),
+                        "function": {"arguments": _safe_get(delta, "partial_json", "")},
+                    }
+                ],
+            }
+
+    return None
 
 
 # ─────────────────────────── client
@@ -161,6 +224,37 @@ class AnthropicLLMClient(OpenAIStyleMixin, BaseLLMClient):
 
         return "\n".join(sys_txt).strip(), out
 
+    def _stream(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Run the blocking event stream in a thread and yield MCP deltas."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def _worker():
+            try:
+                for event in self.client.messages.create(**payload):
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+            except BaseException as exc:
+                # hand SDK errors (429, auth, ...) to the consumer instead of
+                # letting them vanish with the discarded executor future
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        loop.run_in_executor(None, _worker)
+
+        async def _aiter() -> AsyncIterator[Dict[str, Any]]:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                if isinstance(event, BaseException):
+                    raise event
+                delta = _parse_claude_stream_event(event)
+                if delta is not None:
+                    yield delta
+
+        return _aiter()
+
     # ------------- public
     async def create_completion(
         self,
@@ -169,6 +263,7 @@ class AnthropicLLMClient(OpenAIStyleMixin, BaseLLMClient):
         *,
         stream: bool = False,
         max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
         **extra,
     ) -> Dict[str, Any] | AsyncIterator[Dict[str, Any]]:
 
@@ -186,14 +281,22 @@ class AnthropicLLMClient(OpenAIStyleMixin, BaseLLMClient):
             **extra,
         }
         if system_text:            # ← only send if non-empty
-            payload["system"] = system_text
+            payload["system"] = [
+                {
+                    "type": "text",
+                    "text": system_text,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         if anth_tools:
             payload["tool_choice"] = {"type": "auto"}
+        if temperature is not None:
+            payload["temperature"] = temperature
 
         log.debug("Claude payload: %s", payload)
 
         if stream:
-            return self._stream_from_blocking(self.client.messages.create, **payload)
+            return self._stream(payload)
 
         resp = await self._call_blocking(self.client.messages.create, **payload)
         log.debug("Claude raw response: %s", resp)
@@ -26,6 +26,8 @@ class BaseLLMClient(abc.ABC):
         self,
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
+        *,
+        temperature: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Generate (or continue) a chat conversation.
@@ -36,6 +38,8 @@ class BaseLLMClient(abc.ABC):
             List of ChatML-style message dicts.
         tools
             Optional list of OpenAI-function-tool schemas.
+        temperature
+            Sampling temperature; ``None`` keeps the provider's default.
 
         Returns
         -------
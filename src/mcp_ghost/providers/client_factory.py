@@ -4,7 +4,7 @@ LLM client factory for MCP-Ghost.
 """
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Type
 
 from .base import BaseLLMClient
 
@@ -24,6 +24,13 @@ try:
 except ImportError:
     GeminiLLMClient = None
 
+# provider -> (client class or None if unavailable, display name, default model)
+_PROVIDERS: Dict[str, Tuple[Optional[Type[BaseLLMClient]], str, str]] = {
+    "openai": (OpenAILLMClient, "OpenAI", "gpt-4o-mini"),
+    "anthropic": (AnthropicLLMClient, "Anthropic", "claude-3-sonnet-20250219"),
+    "gemini": (GeminiLLMClient, "Gemini", "gemini-2.0-flash"),
+}
+
 
 def get_llm_client(
     provider: str,
@@ -45,32 +52,19 @@ def get_llm_client(
         
     Raises:
         ValueError: If provider is not supported
+        ImportError: If the provider's SDK is not installed
     """
     provider = provider.lower()
     
-    if provider == "openai":
-        if OpenAILLMClient is None:
-            raise ImportError(f"OpenAI client not available. Install required dependencies for {provider}")
-        return OpenAILLMClient(
-            model=model or "gpt-4o-mini",
-            api_key=api_key,
-            **kwargs
-        )
-    elif provider == "anthropic":
-        if AnthropicLLMClient is None:
-            raise ImportError(f"Anthropic client not available. Install required dependencies for {provider}")
-        return AnthropicLLMClient(
-            model=model or "claude-3-sonnet-20250219",
-            api_key=api_key,
-            **kwargs
-        )
-    elif provider == "gemini":
-        if GeminiLLMClient is None:
-            raise ImportError(f"Gemini client not available. Install required dependencies for {provider}")
-        return GeminiLLMClient(
-            model=model or "gemini-2.0-flash",
-            api_key=api_key,
-            **kwargs
-        )
-    else:
-        raise ValueError(f"Unsupported provider: {provider}. Supported: openai, anthropic, gemini")
\ No newline at end of file
+    try:
+        client_cls, display_name, default_model = _PROVIDERS[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported provider: {provider}. Supported: {', '.join(_PROVIDERS)}") from None
+    
+    if client_cls is None:
+        raise ImportError(f"{display_name} client not available. Install required dependencies for {provider}")
+    return client_cls(
+        model=model or default_model,
+        api_key=api_key,
+        **kwargs
+    )
@@ -13,6 +13,11 @@ Key features
 Implementation details
 ---------------------
 * Blocking SDK calls are wrapped in `asyncio.to_thread`.
+* The system instruction + tool declarations are stored as a Gemini
+  `cachedContent` (one per distinct prefix, TTL-bound) and referenced on
+  subsequent calls, so repeated turns don't re-bill the static prefix.
+  Prefixes the API refuses to cache (e.g. below the minimum size) are sent
+  inline as before.
 * All crucial transformation steps now emit `log.debug(...)` lines so you can
   trace exactly what goes to / comes from the Gemini backend.
 """
@@ -20,10 +25,14 @@ Implementation details
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
@@ -153,6 +162,9 @@ def _convert_tools(tools: Optional[List[Dict[str, Any]]]) -> Tuple[List[gtypes.T
 class GeminiLLMClient(BaseLLMClient):
     """`google-genai` wrapper with MCP-Ghost interface."""
 
+    CACHE_TTL_SECONDS = 600
+    CACHE_MAX_ENTRIES = 64
+
     def __init__(self, model: str = "gemini-2.0-flash", *, api_key: Optional[str] = None) -> None:
         load_dotenv()
         api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -161,14 +173,66 @@ class GeminiLLMClient(BaseLLMClient):
 
         self.model = model
         self.client = genai.Client(api_key=api_key)
+        # LRU of prefix digest -> (cachedContent name, local expiry); touched from worker threads
+        self._content_caches: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._content_caches_lock = threading.Lock()
         log.info("GeminiLLMClient initialised with model '%s'", model)
 
+    # ---------------------------------------------------------------- context caching
+    def _cached_content(self, system_txt: Optional[str], gem_tools: List[gtypes.Tool], tool_cfg: Optional[gtypes.ToolConfig]) -> Optional[str]:
+        """Return the `cachedContent` name for this prefix, creating it on first use.
+
+        Blocking (may call the caches API) – only call from a worker thread.
+        """
+        if not system_txt:
+            return None
+
+        key = hashlib.sha256(repr((self.model, system_txt, gem_tools, tool_cfg)).encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        with self._content_caches_lock:
+            entry = self._content_caches.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._content_caches.move_to_end(key)
+                    return entry[0]
+                del self._content_caches[key]
+
+        try:
+            cache = self.client.caches.create(
+                model=self.model,
+                config=gtypes.CreateCachedContentConfig(
+                    system_instruction=system_txt,
+                    tools=gem_tools or None,
+                    tool_config=tool_cfg,
+                    ttl=f"{self.CACHE_TTL_SECONDS}s",
+                ),
+            )
+            name: Optional[str] = cache.name
+            log.debug("Created context cache %s", name)
+        except Exception as exc:
+            log.debug("Context caching unavailable (%s) – sending prefix inline", exc)
+            name = None
+
+        # expire a little early so we never reference a cache the server dropped
+        with self._content_caches_lock:
+            self._content_caches[key] = (name, now + self.CACHE_TTL_SECONDS - 30)
+            self._content_caches.move_to_end(key)
+            while len(self._content_caches) > self.CACHE_MAX_ENTRIES:
+                self._content_caches.popitem(last=False)
+        return name
+
+    def _build_config(self, system_txt: Optional[str], gem_tools: List[gtypes.Tool], tool_cfg: Optional[gtypes.ToolConfig], temperature: Optional[float] = None) -> gtypes.GenerateContentConfig:
+        cached = self._cached_content(system_txt, gem_tools, tool_cfg)
+        if cached:
+            return gtypes.GenerateContentConfig(cached_content=cached, temperature=temperature)
+        return gtypes.GenerateContentConfig(system_instruction=system_txt or None, tools=gem_tools or None, tool_config=tool_cfg, temperature=temperature)
+
     # ---------------------------------------------------------------- sync (non-streaming)
-    def _create_sync(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _create_sync(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]], temperature: Optional[float] = None) -> Dict[str, Any]:
         system_txt, contents = _convert_messages(messages)
         gem_tools, tool_cfg = _convert_tools(tools)
 
-        cfg = gtypes.GenerateContentConfig(system_instruction=system_txt or None, tools=gem_tools or None, tool_config=tool_cfg)
+        cfg = self._build_config(system_txt, gem_tools, tool_cfg, temperature)
         log.debug("GenerateContentConfig: %s", cfg)
         log.debug("Sending request to Gemini…")
 
@@ -177,38 +241,45 @@ class GeminiLLMClient(BaseLLMClient):
         return _parse_final_response(resp)
 
     # ---------------------------------------------------------------- streaming helpers
-    def _stream(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]]) -> AsyncIterator[Dict[str, Any]]:
+    def _stream(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]], temperature: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
         system_txt, contents = _convert_messages(messages)
         gem_tools, tool_cfg = _convert_tools(tools)
-        cfg = gtypes.GenerateContentConfig(system_instruction=system_txt or None, tools=gem_tools or None, tool_config=tool_cfg)
 
+        loop = asyncio.get_running_loop()
         queue: asyncio.Queue = asyncio.Queue()
 
         def _producer():
             try:
+                # may create a context cache over the network, so build it off the loop
+                cfg = self._build_config(system_txt, gem_tools, tool_cfg, temperature)
                 for chunk in self.client.models.generate_content_stream(model=self.model, contents=contents, config=cfg):
-                    queue.put_nowait(chunk)
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except BaseException as exc:
+                # surface SDK errors to the consumer; the executor future is discarded
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
             finally:
-                queue.put_nowait(None)
+                loop.call_soon_threadsafe(queue.put_nowait, None)
 
-        asyncio.get_running_loop().run_in_executor(None, _producer)
+        loop.run_in_executor(None, _producer)
 
         async def _aiter():
             while True:
                 chunk = await queue.get()
                 if chunk is None:
                     break
+                if isinstance(chunk, BaseException):
+                    raise chunk
                 text_piece, t_calls = _parse_stream_chunk(chunk)
                 yield {"response": text_piece, "tool_calls": t_calls}
 
         return _aiter()
 
     # ---------------------------------------------------------------- async facade
-    async def create_completion(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None, *, stream: bool = False) -> Dict[str, Any] | AsyncIterator[Dict[str, Any]]:
+    async def create_completion(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None, *, stream: bool = False, temperature: Optional[float] = None) -> Dict[str, Any] | AsyncIterator[Dict[str, Any]]:
         log.debug("create_completion called – stream=%s", stream)
         if stream:
-            return self._stream(messages, tools)
-        return await asyncio.to_thread(self._create_sync, messages, tools)
+            return self._stream(messages, tools, temperature)
+        return await asyncio.to_thread(self._create_sync, messages, tools, temperature)
 
 
 # ───────────────────────────────────────── parse helpers ──────────
@@ -230,6 +301,22 @@ def _parse_stream_chunk(chunk) -> Tuple[str, List[Dict[str, Any]]]:
     return delta_text, calls
 
 
+def _parse_usage(resp) -> Dict[str, int]:
+    meta = getattr(resp, "usage_metadata", None)
+
+    def _count(key: str) -> int:
+        value = getattr(meta, key, 0)
+        return value if isinstance(value, int) else 0
+
+    return {
+        "prompt_tokens": _count("prompt_token_count"),
+        "completion_tokens": _count("candidates_token_count"),
+        "total_tokens": _count("total_token_count"),
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": _count("cached_content_token_count"),
+    }
+
+
 def _parse_final_response(resp) -> Dict[str, Any]:
     main_text: str = ""
     tool_calls: List[Dict[str, Any]] = []
@@ -248,6 +335,7 @@ def _parse_final_response(resp) -> Dict[str, Any]:
 
     log.debug("Parsed text='%s…', tool_calls=%d", main_text[:60], len(tool_calls))
 
+    usage = _parse_usage(resp)
     if tool_calls and not main_text.strip():
-        return {"response": None, "tool_calls": tool_calls}
-    return {"response": main_text.strip(), "tool_calls": tool_calls}
\ No newline at end of file
+        return {"response": None, "tool_calls": tool_calls, "usage": usage}
+    return {"response": main_text.strip(), "tool_calls": tool_calls, "usage": usage}
\ No newline at end of file
@@ -5,6 +5,8 @@ OpenAI chat-completion adapter for MCP-Ghost.
 • Shares sanitising / normalising / streaming helpers via OpenAIStyleMixin.
 • create_completion(..., stream=False) → single MCP dict  (legacy behaviour)
 • create_completion(..., stream=True)  → async iterator of MCP-style deltas.
+• Prompt caching is automatic on OpenAI; cached prefix tokens are reported
+  as ``usage["cache_read_input_tokens"]``.
 """
 from __future__ import annotations
 
@@ -46,12 +48,14 @@ class OpenAILLMClient(OpenAIStyleMixin, BaseLLMClient):
         tools: Optional[List[Dict[str, Any]]] = None,
         *,
         stream: bool = False,
+        temperature: Optional[float] = None,
     ) -> Dict[str, Any] | AsyncIterator[Dict[str, Any]]:
         """
         • stream=False → returns a single normalised dict
         • stream=True  → returns an async iterator yielding MCP-delta dicts
         """
         tools = self._sanitize_tool_names(tools)
+        sampling = {"temperature": temperature} if temperature is not None else {}
 
         # 1️⃣ streaming
         if stream:
@@ -60,6 +64,7 @@ class OpenAILLMClient(OpenAIStyleMixin, BaseLLMClient):
                 model=self.model,
                 messages=messages,
                 tools=tools or [],
+                **sampling,
             )
 
         # 2️⃣ one-shot
@@ -68,5 +73,8 @@ class OpenAILLMClient(OpenAIStyleMixin, BaseLLMClient):
             model=self.model,
             messages=messages,
             tools=tools or [],
+            **sampling,
         )
-        return self._normalise_message(resp.choices[0].message)
\ No newline at end of file
+        result = self._normalise_message(resp.choices[0].message)
+        result["usage"] = self._normalise_usage(getattr(resp, "usage", None))
+        return result
\ No newline at end of file
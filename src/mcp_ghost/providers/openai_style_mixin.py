@@ -28,11 +28,20 @@ class OpenAIStyleMixin:
       • _sanitize_tool_names
       • _call_blocking          – run blocking SDK in thread
       • _normalise_message      – convert full message → MCP dict
+      • _normalise_usage        – convert `response.usage` → token counters
       • _stream_from_blocking   – wrap *stream=True* SDK generators
     """
 
     # ------------------------------------------------------------------ sanitise
     _NAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+    # same mapping as _NAME_RE for ASCII names, applied in one str.translate pass
+    _NAME_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+
+    @classmethod
+    def _sanitize_tool_name(cls, name: str) -> str:
+        if name.isascii():
+            return name.translate(cls._NAME_TABLE)
+        return cls._NAME_RE.sub("_", name)
 
     @classmethod
     def _sanitize_tool_names(cls, tools: Optional[List[Tool]]) -> Optional[List[Tool]]:
@@ -43,11 +52,11 @@ class OpenAIStyleMixin:
             copy = dict(t)
             fn = copy.get("function", {})
             name = fn.get("name")
-            if name and cls._NAME_RE.search(name):
-                clean = cls._NAME_RE.sub("_", name)
-                logging.debug("Sanitising tool name '%s' → '%s'", name, clean)
-                fn["name"] = clean
-                copy["function"] = fn
+            if name:
+                clean = cls._sanitize_tool_name(name)
+                if clean != name:
+                    logging.debug("Sanitising tool name '%s' → '%s'", name, clean)
+                    copy["function"] = {**fn, "name": clean}
             fixed.append(copy)
         return fixed
 
@@ -93,6 +102,24 @@ class OpenAIStyleMixin:
 
         return {"response": msg.content if not calls else None, "tool_calls": calls}
 
+    @staticmethod
+    def _normalise_usage(usage) -> Dict[str, int]:
+        """
+        Convert an OpenAI-style `response.usage` object → token counters.
+        """
+        def _count(obj, key: str) -> int:
+            value = getattr(obj, key, 0)
+            return value if isinstance(value, int) else 0
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "prompt_tokens": _count(usage, "prompt_tokens"),
+            "completion_tokens": _count(usage, "completion_tokens"),
+            "total_tokens": _count(usage, "total_tokens"),
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": _count(details, "cached_tokens"),
+        }
+
     # ------------------------------------------------------------------ streaming
     @classmethod
     def _stream_from_blocking(
@@ -114,6 +141,7 @@ class OpenAIStyleMixin:
                 tools=tools or [],
             )
         """
+        loop = asyncio.get_running_loop()
         queue: asyncio.Queue = asyncio.Queue()
 
         async def _aiter() -> AsyncIterator[LLMResult]:
@@ -121,19 +149,24 @@ class OpenAIStyleMixin:
                 chunk = await queue.get()
                 if chunk is None:               # sentinel from worker
                     break
+                if isinstance(chunk, BaseException):
+                    raise chunk
                 delta = chunk.choices[0].delta
                 yield {
                     "response": delta.content or "",
                     "tool_calls": getattr(delta, "tool_calls", []),
                 }
 
-        # run the blocking generator in a thread
+        # run the blocking generator in a thread; asyncio.Queue isn't
+        # thread-safe, so hand each chunk to the loop
         def _worker():
             try:
                 for ch in sdk_call(stream=True, **kwargs):
-                    queue.put_nowait(ch)
+                    loop.call_soon_threadsafe(queue.put_nowait, ch)
+            except BaseException as exc:    # re-raised by _aiter
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
             finally:
-                queue.put_nowait(None)
+                loop.call_soon_threadsafe(queue.put_nowait, None)
 
-        asyncio.get_running_loop().run_in_executor(None, _worker)
+        loop.run_in_executor(None, _worker)
         return _aiter()
\ No newline at end of file
@@ -3,10 +3,62 @@
 Adapters for transforming tool names and definitions for different LLM providers.
 """
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, List
 
 from .models import ToolInfo
 
+_OPENAI_INVALID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_GEMINI_INVALID_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# str.translate tables for the ASCII case: every disallowed code point -> "_"
+_OPENAI_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "_-")}
+_GEMINI_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+
+
+def _is_safe_identifier(value: str) -> bool:
+    """True if *value* is already made of [a-zA-Z0-9_] only (no sanitizing needed)."""
+    return value.isascii() and value.isidentifier()
+
+
+def _sanitize(value: str, table: Dict[int, str], invalid_re: re.Pattern) -> str:
+    """Replace disallowed characters with "_"; one C-level translate pass for ASCII input."""
+    if value.isascii():
+        return value.translate(table)
+    return invalid_re.sub('_', value)
+
+
+# Tool catalogs are fixed per server, so the same (namespace, name) pairs are
+# adapted over and over; memoize the sanitizing converters.
+@lru_cache(maxsize=2048)
+def _openai_name(namespace: str, name: str) -> str:
+    # Combine namespace and name with underscore
+    combined = f"{namespace}_{name}"
+    
+    # Sanitize to ensure it matches OpenAI's pattern
+    if _is_safe_identifier(combined):
+        sanitized = combined
+    else:
+        sanitized = _sanitize(combined, _OPENAI_TABLE, _OPENAI_INVALID_RE)
+    
+    # Limit length to 200 characters (reasonable limit for function names)
+    if len(sanitized) > 200:
+        # Truncate but try to keep both namespace and name parts
+        max_namespace = min(len(namespace), 80)
+        max_name = 200 - max_namespace - 1  # -1 for underscore
+        sanitized = f"{namespace[:max_namespace]}_{name[:max_name]}"
+    
+    return sanitized
+
+
+@lru_cache(maxsize=2048)
+def _gemini_name(namespace: str, name: str) -> str:
+    # Similar to OpenAI but may have different restrictions
+    combined = f"{namespace}_{name}"
+    if _is_safe_identifier(combined):
+        return combined
+    return _sanitize(combined, _GEMINI_TABLE, _GEMINI_INVALID_RE)
+
 
 class ToolNameAdapter:
     """Handles adaptation between provider-compatible tool names and MCP original names."""
@@ -18,20 +70,7 @@ class ToolNameAdapter:
         
         OpenAI requires function names to match: ^[a-zA-Z0-9_-]+$
         """
-        # Combine namespace and name with underscore
-        combined = f"{namespace}_{name}"
-        
-        # Sanitize to ensure it matches OpenAI's pattern
-        sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', combined)
-        
-        # Limit length to 200 characters (reasonable limit for function names)
-        if len(sanitized) > 200:
-            # Truncate but try to keep both namespace and name parts
-            max_namespace = min(len(namespace), 80)
-            max_name = 200 - max_namespace - 1  # -1 for underscore
-            sanitized = f"{namespace[:max_namespace]}_{name[:max_name]}"
-        
-        return sanitized
+        return _openai_name(namespace, name)
     
     @staticmethod
     def to_anthropic_compatible(namespace: str, name: str) -> str:
@@ -49,10 +88,7 @@ class ToolNameAdapter:
         
         Gemini has its own naming requirements.
         """
-        # Similar to OpenAI but may have different restrictions
-        combined = f"{namespace}_{name}"
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', combined)
-        return sanitized
+        return _gemini_name(namespace, name)
     
     @staticmethod
     def from_openai_compatible(openai_name: str) -> str:
@@ -63,7 +99,33 @@ class ToolNameAdapter:
         return openai_name
     
     @staticmethod
-    def adapt_for_provider(namespace: str, name: str, provider: str) -> str:
+    def to_default(namespace: str, name: str) -> str:
+        """Fallback format for unknown providers: ``namespace.name``."""
+        return f"{namespace}.{name}"
+    
+    # Built once with the class rather than on every converter_for() call
+    _CONVERTERS: Dict[str, Callable[[str, str], str]] = {
+        "openai": to_openai_compatible.__func__,
+        "anthropic": to_anthropic_compatible.__func__,
+        "gemini": to_gemini_compatible.__func__,
+    }
+    
+    @classmethod
+    def converter_for(cls, provider: str) -> Callable[[str, str], str]:
+        """
+        Resolve the name converter for a provider once, so callers adapting
+        many tools don't repeat the lookup per tool.
+        
+        Args:
+            provider: Provider name ("openai", "anthropic", "gemini")
+            
+        Returns:
+            Function mapping ``(namespace, name)`` to a provider-compatible name
+        """
+        return cls._CONVERTERS.get(provider.lower(), cls.to_default)
+    
+    @classmethod
+    def adapt_for_provider(cls, namespace: str, name: str, provider: str) -> str:
         """
         Adapt tool name for specific provider.
         
@@ -75,20 +137,10 @@ class ToolNameAdapter:
         Returns:
             Provider-compatible tool name
         """
-        provider = provider.lower()
-        
-        if provider == "openai":
-            return ToolNameAdapter.to_openai_compatible(namespace, name)
-        elif provider == "anthropic":
-            return ToolNameAdapter.to_anthropic_compatible(namespace, name)
-        elif provider == "gemini":
-            return ToolNameAdapter.to_gemini_compatible(namespace, name)
-        else:
-            # Default to namespace.name format
-            return f"{namespace}.{name}"
+        return cls.converter_for(provider)(namespace, name)
     
-    @staticmethod
-    def build_mapping(tools: List[ToolInfo], provider: str) -> Dict[str, str]:
+    @classmethod
+    def build_mapping(cls, tools: List[ToolInfo], provider: str) -> Dict[str, str]:
         """
         Build a mapping between provider-compatible names and original names.
         
@@ -99,15 +151,14 @@ class ToolNameAdapter:
         Returns:
             Dictionary mapping provider names to original names
         """
-        mapping = {}
-        for tool in tools:
-            provider_name = ToolNameAdapter.adapt_for_provider(tool.namespace, tool.name, provider)
-            original_name = f"{tool.namespace}.{tool.name}"
-            mapping[provider_name] = original_name
-        return mapping
+        convert = cls.converter_for(provider)
+        return {
+            convert(tool.namespace, tool.name): tool.qualified_name
+            for tool in tools
+        }
     
-    @staticmethod
-    def adapt_tools(tools: List[Dict], namespace: str, provider: str) -> List[Dict]:
+    @classmethod
+    def adapt_tools(cls, tools: List[Dict], namespace: str, provider: str) -> List[Dict]:
         """
         Adapt a list of tools for a specific provider.
         
@@ -120,11 +171,12 @@ class ToolNameAdapter:
             List of adapted tools with provider-compatible names
         """
         adapted_tools = []
+        convert = cls.converter_for(provider)
         
         for tool in tools:
             # Create provider-compatible tool name
             original_name = tool["name"]
-            adapted_name = ToolNameAdapter.adapt_for_provider(namespace, original_name, provider)
+            adapted_name = convert(namespace, original_name)
             
             # Create adapted tool definition
             adapted_tool = {
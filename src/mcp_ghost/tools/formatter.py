@@ -1,9 +1,9 @@
 # mcp_ghost/tools/formatter.py
 """Tool formatting utilities for different providers."""
 from typing import List, Dict, Any, Optional
-import json
 
 from .models import ToolInfo, ToolCallResult
+from ..utils.json_utils import dumps
 
 
 def format_tool_for_openai(tool: ToolInfo) -> Dict[str, Any]:
@@ -18,14 +18,8 @@ def format_tool_for_openai(tool: ToolInfo) -> Dict[str, Any]:
     }
 
 
-def _serialize_for_json(obj):
-    """Helper to handle non-serializable objects."""
-    if hasattr(obj, '__dict__'):
-        return str(obj)
-    elif hasattr(obj, '__str__'):
-        return str(obj)
-    else:
-        return repr(obj)
+# Exact types returned as str() without the list/dict checks below
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def format_tool_response(response_content: Any) -> str:
@@ -38,20 +32,31 @@ def format_tool_response(response_content: Any) -> str:
     Returns:
         Formatted string suitable for LLM processing
     """
+    if type(response_content) in _SCALAR_TYPES:
+        return str(response_content)
+    
     # Handle list of dictionaries (likely structured data like SQL results)
     if isinstance(response_content, list) and response_content and isinstance(response_content[0], dict):
-        # Treat as text records only if every item has type == "text"
-        if all(isinstance(item, dict) and item.get("type") == "text" for item in response_content):
-            return "\n".join(item.get("text", "") for item in response_content)
-        # This could be data records (like SQL results)
+        # Treat as text records only if every item has type == "text";
+        # collect the texts in the same pass that classifies the list
+        texts = []
+        for item in response_content:
+            if not (isinstance(item, dict) and item.get("type") == "text"):
+                texts = None
+                break
+            texts.append(item.get("text", ""))
+        if texts is not None:
+            return "\n".join(texts)
+        # This could be data records (like SQL results); non-serializable
+        # leaves are encoded as str(obj)
         try:
-            return json.dumps(response_content, indent=2, default=_serialize_for_json, ensure_ascii=False)
+            return dumps(response_content, indent=True, default=str)
         except Exception:
             return str(response_content)
     elif isinstance(response_content, dict):
         # Single dictionary - return as JSON
         try:
-            return json.dumps(response_content, indent=2, default=_serialize_for_json, ensure_ascii=False)
+            return dumps(response_content, indent=True, default=str)
         except Exception:
             return str(response_content)
     else:
@@ -69,13 +74,7 @@ def format_tool_call_result(result: ToolCallResult) -> str:
 
 def format_tools_for_provider(tools: List[ToolInfo], provider: str) -> List[Dict[str, Any]]:
     """Format tools for specific provider."""
-    provider = provider.lower()
-    
-    if provider == "openai":
-        return [format_tool_for_openai(tool) for tool in tools]
-    elif provider in ["anthropic", "gemini"]:
-        # Both use similar OpenAI-style format
-        return [format_tool_for_openai(tool) for tool in tools]
-    else:
-        # Default to OpenAI format
-        return [format_tool_for_openai(tool) for tool in tools]
\ No newline at end of file
+    # OpenAI, Anthropic, Gemini and unknown providers all take the OpenAI-style
+    # schema (the provider clients convert it), so there is nothing to branch on
+    fmt = format_tool_for_openai
+    return [fmt(tool) for tool in tools]
\ No newline at end of file
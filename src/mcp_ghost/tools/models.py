@@ -9,9 +9,9 @@ from typing import Any, Dict, List, Optional
 # ──────────────────────────────────────────────────────────────────────────────
 # Tool-related models
 # ──────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolInfo:
-    """Information about a tool."""
+    """Information about a tool (immutable, so instances can be shared)."""
     name: str
     namespace: str
     description: Optional[str] = None
@@ -20,6 +20,11 @@ class ToolInfo:
     tags: List[str] = field(default_factory=list)
     supports_streaming: bool = False
 
+    @property
+    def qualified_name(self) -> str:
+        """The MCP-style ``namespace.name`` identifier."""
+        return f"{self.namespace}.{self.name}"
+
 
 @dataclass
 class ServerInfo:
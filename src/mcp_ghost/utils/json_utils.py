@@ -0,0 +1,48 @@
+"""
+JSON (de)serialization for the tool-call hot path.
+
+Uses ``orjson`` when it is installed (see the ``speedups`` extra) and falls
+back to the stdlib ``json`` module otherwise, or for values orjson can't
+encode (e.g. integers wider than 64 bits).
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize *obj* to a JSON string with non-ASCII characters left as-is.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with a two-space indent
+        default: Called for objects that aren't natively serializable
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    # Compact separators match orjson byte for byte, so the text (and any
+    # cache key built from it) doesn't depend on which encoder ran
+    if indent:
+        return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON text (``str`` or ``bytes``)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
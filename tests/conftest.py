@@ -1,30 +1,130 @@
 """Test configuration and fixtures for MCP-Ghost tests."""
-import pytest
-import asyncio
-import sys
+import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
+
+import pytest
 from unittest.mock import Mock, AsyncMock
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Configure pytest-asyncio to avoid deprecation warnings
+pytest_plugins = ["pytest_asyncio"]
+
+GOLDENS_DIR = Path(__file__).parent / "goldens"
+
+
+def _load_golden(golden_path):
+    """Parse a golden file (orjson when available)."""
+    data = golden_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_golden(data):
+    """Serialize a golden as indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def golden_cache():
+    """Every recorded golden file, keyed by ``(provider, test_name)``.
 
+    Loaded once per session so replay tests never touch the filesystem.
+    Shared: don't mutate.
+    """
+    cache = {}
+    for golden_path in sorted(GOLDENS_DIR.glob("*/*.json")):
+        data = _load_golden(golden_path)
+        cache[(golden_path.parent.name, data.get("test_name") or golden_path.stem)] = data
+    yield cache
 
-# Configure pytest-asyncio to avoid deprecation warnings
-pytest_plugins = ["pytest_asyncio"]
+
+class GoldenDraft:
+    """One golden being recorded; ``save_golden()`` queues it on the sink."""
+    
+    def __init__(self, sink, test_name, provider):
+        self.sink = sink
+        self.provider = provider
+        self.data = {"test_name": test_name, "input": {}, "golden_output": {}, "provider_responses": []}
+    
+    def set_input(self, **inputs):
+        self.data["input"] = {**inputs, "provider": self.provider}
+    
+    def record_provider_interaction(self, request, response, token_usage):
+        responses = self.data["provider_responses"]
+        responses.append({
+            "iteration": len(responses) + 1,
+            "request": request,
+            "response": response,
+            "token_usage": token_usage,
+        })
+    
+    def set_golden_output(self, output):
+        self.data["golden_output"] = output
+    
+    def save_golden(self):
+        """Queue the golden for the end-of-session write; returns its path."""
+        self.data["recorded_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        return self.sink.queue(self.provider, self.data)
+
+
+class GoldenSink:
+    """Goldens recorded this session, written once each at session teardown."""
+    
+    def __init__(self, goldens_dir):
+        self.goldens_dir = goldens_dir
+        self.pending = {}
+    
+    def recorder(self, test_name, provider):
+        return GoldenDraft(self, test_name, provider)
+    
+    def queue(self, provider, data):
+        golden_path = self.goldens_dir / provider / f"{data['test_name']}.json"
+        self.pending[golden_path] = data
+        return golden_path
+    
+    def flush(self):
+        """Write every queued golden (temp file + rename, so readers never see half a file)."""
+        for golden_path, data in self.pending.items():
+            golden_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = golden_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(_dump_golden(data))
+            os.replace(tmp_path, golden_path)
+        self.pending.clear()
+
+
+@pytest.fixture(scope="session")
+def golden_sink():
+    """Collects goldens recorded with ``RECORD_GOLDENS=true`` and writes them at session end."""
+    sink = GoldenSink(GOLDENS_DIR)
+    yield sink
+    sink.flush()
 
 
 @pytest.fixture
+def llm_mock(monkeypatch):
+    """Swap the Anthropic SDK client for a Mock for one test.
+
+    Replay tests set ``llm_mock.return_value.messages.create.return_value``.
+    Returns None when recording (``RECORD_GOLDENS=true``) so real calls go through.
+    """
+    if os.getenv("RECORD_GOLDENS", "").lower() == "true":
+        return None
+    fake_cls = Mock()
+    monkeypatch.setattr("mcp_ghost.providers.anthropic_client.Anthropic", fake_cls)
+    return fake_cls
+
+
+@pytest.fixture(scope="session")
 def sample_tool_info():
     """Fixture providing a sample ToolInfo instance."""
     try:
@@ -54,9 +154,12 @@ def sample_tool_info():
         )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_server_config():
-    """Sample server configuration for testing."""
+    """Sample server configuration for testing.
+
+    Session-scoped and shared: tests that mutate it must ``copy.deepcopy`` first.
+    """
     return {
         "mcpServers": {
             "test_server": {
@@ -67,6 +170,15 @@ def sample_server_config():
     }
 
 
+@pytest.fixture(autouse=True)
+def _reset_client_pool():
+    """Keep pooled LLM clients (usually mocks) from leaking between tests."""
+    from mcp_ghost.core import _client_pool
+    _client_pool.clear()
+    yield
+    _client_pool.clear()
+
+
 @pytest.fixture
 def mock_llm_client():
     """Mock LLM client for testing."""
@@ -79,9 +191,9 @@ def mock_llm_client():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_openai_tools():
-    """Fixture providing sample tools in OpenAI format."""
+    """Fixture providing sample tools in OpenAI format (shared; don't mutate)."""
     return [
         {
             "type": "function",
@@ -100,9 +212,30 @@ def sample_openai_tools():
     ]
 
 
+def pytest_addoption(parser):
+    """Add the --run-live opt-in for tests that call real LLM APIs."""
+    parser.addoption(
+        "--run-live", action="store_true", default=False,
+        help="run tests marked 'live' (real API calls)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``live`` tests at collection time unless --run-live is given."""
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="live API test (use --run-live)")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
 # Test markers for different test categories
 def pytest_configure(config):
-    """Configure custom pytest markers."""
+    """Load .env once (before collection, so module-level key checks see it) and register markers."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     config.addinivalue_line(
         "markers", "unit: mark test as a unit test"
     )
@@ -114,4 +247,7 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "record_golden: mark test for golden test recording"
+    )
+    config.addinivalue_line(
+        "markers", "live: mark test as calling real LLM APIs (needs --run-live)"
     )
\ No newline at end of file
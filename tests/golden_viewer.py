@@ -14,191 +14,348 @@ Opens a web interface to browse and inspect golden test files with:
 """
 
 import argparse
+import gzip
+import hashlib
 import json
 import os
+import threading
 import webbrowser
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from functools import lru_cache
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
-import html
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class GoldenViewerHandler(SimpleHTTPRequestHandler):
-    """Custom handler for serving golden test viewer."""
+
+def _loads(data):
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data):
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _total_tokens(data):
+    """golden_output.execution_metadata.token_usage.total_tokens, or 0."""
+    try:
+        return data["golden_output"]["execution_metadata"]["token_usage"]["total_tokens"]
+    except (KeyError, TypeError):
+        return 0
+
+
+def _success(data):
+    """golden_output.success, or None if it wasn't recorded."""
+    try:
+        return data["golden_output"]["success"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _user_prompt(data):
+    """input.user_prompt, or an empty string."""
+    try:
+        return data["input"]["user_prompt"]
+    except (KeyError, TypeError):
+        return ""
+
+
+def _summarize_golden(golden_path, data):
+    """
+    Build the /api/goldens entry for a golden file.
     
-    def __init__(self, *args, **kwargs):
-        self.goldens_dir = Path(__file__).parent / "goldens"
-        super().__init__(*args, **kwargs)
+    The same dict feeds the provider stats (``success`` and ``tokens``).
+    It is cached and shared between scans, so treat it as read-only.
+    """
+    provider = golden_path.parent.name
+    return {
+        "provider": provider,
+        "test_name": data.get("test_name") or golden_path.stem,
+        "file_path": f"{provider}/{golden_path.name}",
+        "recorded_at": data.get("recorded_at"),
+        "user_prompt": _user_prompt(data)[:100],
+        "success": _success(data),
+        "iterations": len(data.get("provider_responses", [])),
+        "tokens": _total_tokens(data)
+    }
+
+
+@lru_cache(maxsize=512)
+def _load_summary_cached(path_str, mtime_ns, size):
+    """Parse and summarize a golden file; the (mtime_ns, size) key drops stale entries."""
+    golden_path = Path(path_str)
+    return _summarize_golden(golden_path, _loads(golden_path.read_bytes()))
+
+
+def _try_load_summary(signature):
+    """Summarize a golden file from its (path, mtime_ns, size), returning any error."""
+    try:
+        return _load_summary_cached(*signature)
+    except Exception as e:
+        # A malformed golden (bad JSON, a list at the top level, ...) is
+        # reported and skipped by the scan rather than failing it
+        return e
+
+
+# Shared across requests; overlaps file reads on a cold cache
+_loader_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="golden-loader")
+
+
+def _load_summaries(signatures):
+    """Summarize many golden files in parallel; yields summaries (or the exception) in order."""
+    return _loader_pool.map(_try_load_summary, signatures)
+
+
+def _list_provider_dirs(goldens_dir):
+    """Names of the provider directories under goldens/."""
+    with os.scandir(goldens_dir) as entries:
+        return [
+            entry.name for entry in entries
+            if entry.is_dir() and entry.name != "__pycache__"
+        ]
+
+
+def _list_golden_files(provider_dir):
+    """
+    ``(path, signature)`` for each *.json in a provider directory.
     
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed_url = urlparse(self.path)
-        
-        if parsed_url.path == "/" or parsed_url.path == "/index.html":
-            self.serve_index()
-        elif parsed_url.path == "/api/goldens":
-            self.serve_golden_list()
-        elif parsed_url.path.startswith("/api/golden/"):
-            self.serve_golden_file(parsed_url.path[12:])  # Remove /api/golden/
-        elif parsed_url.path == "/api/providers":
-            self.serve_provider_stats()
-        else:
-            super().do_GET()
+    The signature is ``(path, mtime_ns, size)``, taken from the scandir entry,
+    so each file is stat'ed once per scan and the result feeds both the scan
+    fingerprint and the summary cache key.
+    """
+    golden_files = []
+    with os.scandir(provider_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Removed while scanning
+            golden_files.append((Path(entry.path), (entry.path, st.st_mtime_ns, st.st_size)))
+    return golden_files
+
+
+# Responses smaller than this aren't worth gzipping
+GZIP_MIN_SIZE = 1024
+
+# Default page size for /api/goldens?offset=...
+GOLDEN_PAGE_SIZE = 50
+
+
+# Result of one scan of goldens/; the *_body fields are the pre-serialized
+# responses for /api/goldens and /api/providers
+GoldenScan = namedtuple("GoldenScan", "goldens stats fingerprint etag goldens_body stats_body")
+
+# Last scan result, reused until the fingerprint of goldens/ changes
+_scan_cache = {}
+_scan_lock = threading.Lock()
+
+
+def _scan_all(goldens_dir):
+    """
+    Walk goldens/ once, building both the sidebar list and the per-provider stats.
     
-    def serve_index(self):
-        """Serve the main HTML interface."""
-        html_content = self.generate_html()
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('Content-Length', len(html_content.encode()))
-        self.end_headers()
-        self.wfile.write(html_content.encode())
-    
-    def serve_golden_list(self):
-        """Serve list of all golden files."""
-        goldens = []
-        
-        for provider_dir in self.goldens_dir.iterdir():
-            if provider_dir.is_dir() and provider_dir.name != "__pycache__":
-                provider = provider_dir.name
-                for golden_file in provider_dir.glob("*.json"):
-                    try:
-                        with open(golden_file) as f:
-                            data = json.load(f)
-                        
-                        goldens.append({
-                            "provider": provider,
-                            "test_name": data.get("test_name", golden_file.stem),
-                            "file_path": f"{provider}/{golden_file.name}",
-                            "recorded_at": data.get("recorded_at"),
-                            "user_prompt": data.get("input", {}).get("user_prompt", "")[:100],
-                            "success": data.get("golden_output", {}).get("success", None),
-                            "iterations": len(data.get("provider_responses", [])),
-                            "tokens": data.get("golden_output", {}).get("execution_metadata", {}).get("token_usage", {}).get("total_tokens", 0)
-                        })
-                    except (json.JSONDecodeError, IOError) as e:
-                        print(f"Error reading {golden_file}: {e}")
-        
-        # Sort by provider, then by test name
-        goldens.sort(key=lambda x: (x["provider"], x["test_name"]))
-        
-        self.send_json_response(goldens)
+    The /api/goldens and /api/providers requests fired on page load share
+    one scan; it is recomputed only when a golden file is added, removed
+    or modified. Returns a GoldenScan; its ``fingerprint`` (a short digest
+    of goldens/) and the ETag built from it change whenever the scan does.
+    """
+    providers = _list_provider_dirs(goldens_dir)
+    golden_files = [
+        (provider, golden_file, signature)
+        for provider in providers
+        for golden_file, signature in _list_golden_files(goldens_dir / provider)
+    ]
+    fingerprint = (
+        tuple(providers),
+        tuple(signature for _, _, signature in golden_files),
+    )
     
-    def serve_golden_file(self, file_path):
-        """Serve a specific golden file."""
-        try:
-            golden_path = self.goldens_dir / file_path
-            if not golden_path.exists():
-                self.send_error(404, f"Golden file not found: {file_path}")
-                return
-            
-            with open(golden_path) as f:
-                data = json.load(f)
-            
-            self.send_json_response(data)
-        except (json.JSONDecodeError, IOError) as e:
-            self.send_error(500, f"Error reading golden file: {e}")
+    with _scan_lock:
+        if _scan_cache.get("fingerprint") == fingerprint:
+            return _scan_cache["result"]
     
-    def serve_provider_stats(self):
-        """Serve provider statistics."""
-        stats = {}
+    goldens = []
+    stats = {
+        provider: {"total_tests": 0, "successful_tests": 0, "total_tokens": 0}
+        for provider in providers
+    }
+    loaded = _load_summaries([signature for _, _, signature in golden_files])
+    
+    for (provider, golden_file, _), summary in zip(golden_files, loaded):
+        provider_stats = stats[provider]
+        provider_stats["total_tests"] += 1
         
-        for provider_dir in self.goldens_dir.iterdir():
-            if provider_dir.is_dir() and provider_dir.name != "__pycache__":
-                provider = provider_dir.name
-                golden_files = list(provider_dir.glob("*.json"))
-                
-                total_tokens = 0
-                total_tests = len(golden_files)
-                successful_tests = 0
-                
-                for golden_file in golden_files:
-                    try:
-                        with open(golden_file) as f:
-                            data = json.load(f)
-                        
-                        if data.get("golden_output", {}).get("success"):
-                            successful_tests += 1
-                        
-                        tokens = data.get("golden_output", {}).get("execution_metadata", {}).get("token_usage", {}).get("total_tokens", 0)
-                        total_tokens += tokens
-                    except (json.JSONDecodeError, IOError):
-                        pass
-                
-                stats[provider] = {
-                    "total_tests": total_tests,
-                    "successful_tests": successful_tests,
-                    "success_rate": (successful_tests / total_tests * 100) if total_tests > 0 else 0,
-                    "total_tokens": total_tokens,
-                    "avg_tokens": (total_tokens / total_tests) if total_tests > 0 else 0
-                }
+        if isinstance(summary, Exception):
+            print(f"Error reading {golden_file}: {summary}")
+            continue
         
-        self.send_json_response(stats)
+        goldens.append(summary)
+        if summary["success"]:
+            provider_stats["successful_tests"] += 1
+        provider_stats["total_tokens"] += summary["tokens"]
     
-    def send_json_response(self, data):
-        """Send JSON response."""
-        json_data = json.dumps(data, indent=2)
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Content-Length', len(json_data.encode()))
-        self.end_headers()
-        self.wfile.write(json_data.encode())
+    for provider, provider_stats in stats.items():
+        total_tests = provider_stats["total_tests"]
+        successful_tests = provider_stats["successful_tests"]
+        total_tokens = provider_stats["total_tokens"]
+        stats[provider] = {
+            "total_tests": total_tests,
+            "successful_tests": successful_tests,
+            "success_rate": (successful_tests / total_tests * 100) if total_tests > 0 else 0,
+            "total_tokens": total_tokens,
+            "avg_tokens": (total_tokens / total_tests) if total_tests > 0 else 0
+        }
     
-    def generate_html(self):
-        """Generate the main HTML interface."""
-        return '''<!DOCTYPE html>
+    # Sort by provider, then by test name
+    goldens.sort(key=lambda x: (x["provider"], x["test_name"]))
+    
+    digest = hashlib.blake2b(repr(fingerprint).encode(), digest_size=8).hexdigest()
+    result = GoldenScan(goldens, stats, digest, f'W/"{digest}"', _dumps(goldens), _dumps(stats))
+    with _scan_lock:
+        _scan_cache["fingerprint"] = fingerprint
+        _scan_cache["result"] = result
+    return result
+
+
+# Seconds between background rescans of goldens/
+RESCAN_INTERVAL = 2.0
+
+# Directory kept fresh by the background watcher, and its latest scan
+# (swapped as a whole, so readers never see a partial update)
+_watched_dir = None
+_watched_scan = None
+
+
+def _watch_goldens(goldens_dir, interval, stop):
+    """Rescan goldens/ every *interval* seconds until *stop* is set."""
+    global _watched_dir, _watched_scan
+    
+    while not stop.wait(interval):
+        try:
+            _watched_scan = _scan_all(goldens_dir)
+        except Exception as e:
+            # Keep watching; a dead watcher would serve this scan forever
+            print(f"Error scanning {goldens_dir}: {e}")
+    
+    # Stopped: go back to scanning on each request
+    _watched_dir = None
+
+
+def start_golden_watcher(goldens_dir, interval=RESCAN_INTERVAL):
+    """
+    Prewarm the scan cache and keep it fresh from a daemon thread.
+    
+    While the watcher runs, requests are answered from the latest scan
+    without touching the filesystem; changes show up within *interval*
+    seconds. Returns an Event that stops the watcher when set.
+    """
+    global _watched_dir, _watched_scan
+    
+    stop = threading.Event()
+    try:
+        _watched_scan = _scan_all(goldens_dir)
+    except OSError as e:
+        # Fall back to scanning on each request
+        print(f"Not watching {goldens_dir}: {e}")
+        return stop
+    
+    _watched_dir = goldens_dir
+    threading.Thread(
+        target=_watch_goldens,
+        args=(goldens_dir, interval, stop),
+        name="golden-watcher",
+        daemon=True
+    ).start()
+    return stop
+
+
+def _current_scan(goldens_dir):
+    """The latest scan of *goldens_dir*: from the watcher if it runs, else scanned now."""
+    if goldens_dir == _watched_dir:
+        return _watched_scan
+    return _scan_all(goldens_dir)
+
+
+# Served separately from the page so browsers cache it across reloads
+VIEWER_CSS = '''
+body { font-family: 'Segoe UI', system-ui, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+.container { max-width: 1400px; margin: 0 auto; }
+.header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.header h1 { margin: 0; color: #333; }
+.header p { margin: 5px 0 0 0; color: #666; }
+.stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }
+.stat-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.stat-card h3 { margin: 0 0 10px 0; color: #333; font-size: 14px; text-transform: uppercase; }
+.stat-value { font-size: 24px; font-weight: bold; color: #2563eb; }
+.stat-label { font-size: 12px; color: #666; margin-top: 5px; }
+.stat-details { margin-top: 10px; }
+.stat-success { font-size: 14px; color: #10b981; }
+.stat-tokens { font-size: 12px; color: #666; }
+.main-content { display: grid; grid-template-columns: 300px 1fr; gap: 20px; }
+.sidebar { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); height: fit-content; }
+.content { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.golden-list { list-style: none; padding: 0; margin: 0; }
+.golden-item { padding: 10px; border-bottom: 1px solid #eee; cursor: pointer; transition: background 0.2s; }
+.golden-item:hover { background: #f8fafc; }
+.golden-item.selected { background: #e0f2fe; border-left: 3px solid #2563eb; }
+.golden-item .name { font-weight: bold; color: #333; }
+.golden-item .provider { color: #666; font-size: 12px; }
+.golden-item .prompt { color: #888; font-size: 11px; margin-top: 2px; }
+.golden-item .tokens { font-size: 10px; color: #666; margin-left: 5px; }
+.json-viewer { font-family: 'Courier New', monospace; background: #f8f9fa; padding: 15px; border-radius: 4px; overflow: auto; max-height: 600px; }
+.conversation-flow { margin-top: 20px; }
+.message { padding: 10px; margin: 5px 0; border-radius: 8px; }
+.message.user { background: #e3f2fd; border-left: 4px solid #2196f3; }
+.message.assistant { background: #f3e5f5; border-left: 4px solid #9c27b0; }
+.message.tool { background: #e8f5e8; border-left: 4px solid #4caf50; }
+.message-role { font-weight: bold; font-size: 12px; text-transform: uppercase; margin-bottom: 5px; }
+.message-content { white-space: pre-wrap; }
+.tool-calls { margin-top: 10px; }
+.tool-call { background: #fff3e0; padding: 8px; border-radius: 4px; margin: 5px 0; font-size: 12px; }
+.interaction { background: #f8f9fa; padding: 10px; margin: 10px 0; border-radius: 4px; }
+.interaction-tokens { font-size: 12px; color: #666; margin-top: 5px; }
+.metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin-top: 20px; }
+.metric { background: #f8f9fa; padding: 10px; border-radius: 4px; text-align: center; }
+.metric-value { font-size: 20px; font-weight: bold; color: #2563eb; }
+.metric-label { font-size: 12px; color: #666; margin-top: 5px; }
+.loading { text-align: center; padding: 40px; color: #666; }
+.error { color: #dc3545; background: #f8d7da; padding: 15px; border-radius: 4px; margin: 10px 0; }
+.tabs { display: flex; border-bottom: 2px solid #eee; margin-bottom: 20px; }
+.tab { padding: 10px 20px; cursor: pointer; border-bottom: 2px solid transparent; }
+.tab.active { border-bottom-color: #2563eb; color: #2563eb; font-weight: bold; }
+.tab-content { display: none; }
+.tab-content.active { display: block; }
+.provider-badge { background: #2563eb; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; margin-left: 5px; }
+.success-badge { background: #10b981; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; }
+.failure-badge { background: #ef4444; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; }
+'''
+_CSS_BYTES = VIEWER_CSS.encode('utf-8')
+_CSS_GZIP = gzip.compress(_CSS_BYTES)
+# Content hash in the stylesheet URL, so edits bust the immutable browser cache
+_CSS_VERSION = hashlib.blake2b(_CSS_BYTES, digest_size=4).hexdigest()
+
+# The page is static: all data is fetched from the API, so build it once
+INDEX_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>MCP-Ghost Golden Test Viewer</title>
-    <style>
-        body { font-family: 'Segoe UI', system-ui, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
-        .container { max-width: 1400px; margin: 0 auto; }
-        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .header h1 { margin: 0; color: #333; }
-        .header p { margin: 5px 0 0 0; color: #666; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }
-        .stat-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .stat-card h3 { margin: 0 0 10px 0; color: #333; font-size: 14px; text-transform: uppercase; }
-        .stat-value { font-size: 24px; font-weight: bold; color: #2563eb; }
-        .stat-label { font-size: 12px; color: #666; margin-top: 5px; }
-        .main-content { display: grid; grid-template-columns: 300px 1fr; gap: 20px; }
-        .sidebar { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); height: fit-content; }
-        .content { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .golden-list { list-style: none; padding: 0; margin: 0; }
-        .golden-item { padding: 10px; border-bottom: 1px solid #eee; cursor: pointer; transition: background 0.2s; }
-        .golden-item:hover { background: #f8fafc; }
-        .golden-item.selected { background: #e0f2fe; border-left: 3px solid #2563eb; }
-        .golden-item .name { font-weight: bold; color: #333; }
-        .golden-item .provider { color: #666; font-size: 12px; }
-        .golden-item .prompt { color: #888; font-size: 11px; margin-top: 2px; }
-        .json-viewer { font-family: 'Courier New', monospace; background: #f8f9fa; padding: 15px; border-radius: 4px; overflow: auto; max-height: 600px; }
-        .conversation-flow { margin-top: 20px; }
-        .message { padding: 10px; margin: 5px 0; border-radius: 8px; }
-        .message.user { background: #e3f2fd; border-left: 4px solid #2196f3; }
-        .message.assistant { background: #f3e5f5; border-left: 4px solid #9c27b0; }
-        .message.tool { background: #e8f5e8; border-left: 4px solid #4caf50; }
-        .message-role { font-weight: bold; font-size: 12px; text-transform: uppercase; margin-bottom: 5px; }
-        .message-content { white-space: pre-wrap; }
-        .tool-calls { margin-top: 10px; }
-        .tool-call { background: #fff3e0; padding: 8px; border-radius: 4px; margin: 5px 0; font-size: 12px; }
-        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin-top: 20px; }
-        .metric { background: #f8f9fa; padding: 10px; border-radius: 4px; text-align: center; }
-        .metric-value { font-size: 20px; font-weight: bold; color: #2563eb; }
-        .metric-label { font-size: 12px; color: #666; margin-top: 5px; }
-        .loading { text-align: center; padding: 40px; color: #666; }
-        .error { color: #dc3545; background: #f8d7da; padding: 15px; border-radius: 4px; margin: 10px 0; }
-        .tabs { display: flex; border-bottom: 2px solid #eee; margin-bottom: 20px; }
-        .tab { padding: 10px 20px; cursor: pointer; border-bottom: 2px solid transparent; }
-        .tab.active { border-bottom-color: #2563eb; color: #2563eb; font-weight: bold; }
-        .tab-content { display: none; }
-        .tab-content.active { display: block; }
-        .provider-badge { background: #2563eb; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; margin-left: 5px; }
-        .success-badge { background: #10b981; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; }
-        .failure-badge { background: #ef4444; color: white; padding: 2px 6px; border-radius: 4px; font-size: 10px; }
-    </style>
+    <link rel="stylesheet" href="/static/viewer.css?v=__CSS_VERSION__">
 </head>
 <body>
     <div class="container">
@@ -217,6 +374,14 @@ class GoldenViewerHandler(SimpleHTTPRequestHandler):
                 <ul class="golden-list" id="goldenList">
                     <li class="loading">Loading golden files...</li>
                 </ul>
+                <div id="goldenListMore"></div>
+                <template id="goldenItemTemplate">
+                    <li class="golden-item">
+                        <div class="name"><span class="test-name"></span> <span class="status"></span></div>
+                        <div class="provider"><span class="provider-name"></span><span class="provider-badge"></span><span class="tokens"></span></div>
+                        <div class="prompt"></div>
+                    </li>
+                </template>
             </div>
             
             <div class="content">
@@ -236,62 +401,130 @@ class GoldenViewerHandler(SimpleHTTPRequestHandler):
                 const response = await fetch('/api/providers');
                 const stats = await response.json();
                 
-                const statsGrid = document.getElementById('statsGrid');
-                statsGrid.innerHTML = '';
-                
-                Object.entries(stats).forEach(([provider, data]) => {
-                    const card = document.createElement('div');
-                    card.className = 'stat-card';
-                    card.innerHTML = `
-                        <h3>${provider.toUpperCase()}</h3>
-                        <div class="stat-value">${data.total_tests}</div>
-                        <div class="stat-label">Total Tests</div>
-                        <div style="margin-top: 10px;">
-                            <div style="font-size: 14px; color: #10b981;">${data.success_rate.toFixed(1)}% Success</div>
-                            <div style="font-size: 12px; color: #666;">${data.total_tokens.toLocaleString()} tokens used</div>
-                        </div>
-                    `;
-                    statsGrid.appendChild(card);
-                });
+                // Provider names and counts come from golden files, so build text nodes
+                document.getElementById('statsGrid').replaceChildren(
+                    ...Object.entries(stats).map(([provider, data]) => el('div', 'stat-card',
+                        el('h3', null, provider.toUpperCase()),
+                        el('div', 'stat-value', String(data.total_tests)),
+                        el('div', 'stat-label', 'Total Tests'),
+                        el('div', 'stat-details',
+                            el('div', 'stat-success', `${data.success_rate.toFixed(1)}% Success`),
+                            el('div', 'stat-tokens', `${data.total_tokens.toLocaleString()} tokens used`)
+                        )
+                    ))
+                );
             } catch (error) {
                 console.error('Error loading provider stats:', error);
             }
         }
         
-        // Load golden file list
-        async function loadGoldenList() {
+        // Golden file list, fetched a page at a time as the sidebar scrolls
+        const GOLDEN_PAGE_SIZE = 50;
+        let goldenOffset = 0;
+        let goldenTotal = null;
+        let goldenFingerprint = null;
+        let loadingGoldens = false;
+        let goldenObserver = null;
+        
+        // Build a sidebar entry from the template; textContent keeps file data from being parsed as HTML
+        function renderGoldenItem(golden) {
+            const template = document.getElementById('goldenItemTemplate');
+            const item = template.content.firstElementChild.cloneNode(true);
+            item.dataset.filePath = golden.file_path;
+            
+            item.querySelector('.test-name').textContent = golden.test_name;
+            const status = item.querySelector('.status');
+            if (golden.success === true) {
+                status.className = 'success-badge';
+                status.textContent = '✓';
+            } else if (golden.success === false) {
+                status.className = 'failure-badge';
+                status.textContent = '✗';
+            } else {
+                status.remove();
+            }
+            
+            item.querySelector('.provider-name').textContent = golden.provider;
+            item.querySelector('.provider-badge').textContent = `${golden.iterations} calls`;
+            const tokens = item.querySelector('.tokens');
+            if (golden.tokens > 0) {
+                tokens.textContent = `${golden.tokens} tokens`;
+            } else {
+                tokens.remove();
+            }
+            
+            item.querySelector('.prompt').textContent =
+                golden.user_prompt + (golden.user_prompt.length >= 100 ? '...' : '');
+            
+            item.addEventListener('click', () => loadGoldenDetails(golden.file_path, item));
+            return item;
+        }
+        
+        function hasMoreGoldens() {
+            return goldenTotal === null || goldenOffset < goldenTotal;
+        }
+        
+        // Load the next page of the golden file list
+        async function loadGoldenPage() {
+            if (loadingGoldens || !hasMoreGoldens()) return;
+            loadingGoldens = true;
+            let changed = false;
+            
             try {
-                const response = await fetch('/api/goldens');
-                const goldens = await response.json();
-                
-                const goldenList = document.getElementById('goldenList');
-                goldenList.innerHTML = '';
+                // The browser revalidates by ETag, so an unchanged page comes back as a 304
+                const response = await fetch(`/api/goldens?offset=${goldenOffset}&limit=${GOLDEN_PAGE_SIZE}`);
+                const page = await response.json();
                 
-                goldens.forEach((golden, index) => {
-                    const item = document.createElement('li');
-                    item.className = 'golden-item';
-                    item.dataset.filePath = golden.file_path;
-                    
-                    const successBadge = golden.success === true ? 
-                        '<span class="success-badge">✓</span>' : 
-                        golden.success === false ? '<span class="failure-badge">✗</span>' : '';
+                // Goldens changed since the first page: start over so pages don't mix scans
+                changed = goldenFingerprint !== null && page.fingerprint !== goldenFingerprint;
+                if (!changed) {
+                    goldenFingerprint = page.fingerprint;
                     
-                    item.innerHTML = `
-                        <div class="name">${golden.test_name} ${successBadge}</div>
-                        <div class="provider">
-                            ${golden.provider}<span class="provider-badge">${golden.iterations} calls</span>
-                            ${golden.tokens > 0 ? `<span style="font-size: 10px; color: #666; margin-left: 5px;">${golden.tokens} tokens</span>` : ''}
-                        </div>
-                        <div class="prompt">${golden.user_prompt}${golden.user_prompt.length >= 100 ? '...' : ''}</div>
-                    `;
+                    // Build the page off-DOM and attach it in one go (a single reflow)
+                    const fragment = document.createDocumentFragment();
+                    page.goldens.forEach(golden => fragment.appendChild(renderGoldenItem(golden)));
                     
-                    item.addEventListener('click', () => loadGoldenDetails(golden.file_path, item));
-                    goldenList.appendChild(item);
-                });
+                    const goldenList = document.getElementById('goldenList');
+                    if (goldenTotal === null) {
+                        goldenList.replaceChildren(fragment);
+                    } else {
+                        goldenList.appendChild(fragment);
+                    }
+                    goldenOffset += page.goldens.length;
+                    // An empty page means the list shrank underneath us; stop there
+                    goldenTotal = page.goldens.length > 0 ? page.total : goldenOffset;
+                }
             } catch (error) {
                 console.error('Error loading golden list:', error);
-                document.getElementById('goldenList').innerHTML = '<li class="error">Error loading golden files</li>';
+                document.getElementById('goldenList').replaceChildren(el('li', 'error', 'Error loading golden files'));
+                goldenTotal = goldenOffset;
+            } finally {
+                loadingGoldens = false;
+            }
+            
+            if (changed) {
+                goldenOffset = 0;
+                goldenTotal = null;
+                goldenFingerprint = null;
+                return loadGoldenPage();
             }
+            
+            // Re-observe so a sentinel that is still on screen triggers the next page
+            const sentinel = document.getElementById('goldenListMore');
+            goldenObserver.unobserve(sentinel);
+            if (hasMoreGoldens()) {
+                goldenObserver.observe(sentinel);
+            }
+        }
+        
+        // Load golden file list
+        function loadGoldenList() {
+            goldenObserver = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    loadGoldenPage();
+                }
+            });
+            loadGoldenPage();
         }
         
         // Load golden file details
@@ -307,153 +540,168 @@ class GoldenViewerHandler(SimpleHTTPRequestHandler):
                 displayGoldenDetails(currentGoldenData);
             } catch (error) {
                 console.error('Error loading golden details:', error);
-                document.getElementById('goldenDetails').innerHTML = '<div class="error">Error loading golden file details</div>';
+                document.getElementById('goldenDetails').replaceChildren(el('div', 'error', 'Error loading golden file details'));
             }
         }
         
-        // Display golden file details
+        // Build an element; string children become text nodes, so data is never parsed as HTML
+        function el(tag, className, ...children) {
+            const node = document.createElement(tag);
+            if (className) node.className = className;
+            node.append(...children.filter(child => child !== null && child !== undefined));
+            return node;
+        }
+        
+        function truncate(text, length) {
+            return text.length > length ? text.substring(0, length) + '...' : text;
+        }
+        
+        function field(label, value) {
+            return el('p', null, el('strong', null, `${label}:`), ` ${value}`);
+        }
+        
+        function messageBlock(role, label, content, ...extra) {
+            return el('div', `message ${role}`,
+                el('div', 'message-role', label),
+                el('div', 'message-content', content),
+                ...extra
+            );
+        }
+        
+        function tabContent(id, active, ...children) {
+            const node = el('div', active ? 'tab-content active' : 'tab-content', ...children);
+            node.id = id;
+            return node;
+        }
+        
+        // Display golden file details; tabs other than Overview are rendered when first opened
         function displayGoldenDetails(data) {
-            const detailsContainer = document.getElementById('goldenDetails');
-            
-            const tabs = `
-                <div class="tabs">
-                    <div class="tab active" onclick="showTab('overview')">Overview</div>
-                    <div class="tab" onclick="showTab('conversation')">Conversation</div>
-                    <div class="tab" onclick="showTab('metrics')">Metrics</div>
-                    <div class="tab" onclick="showTab('raw')">Raw JSON</div>
-                </div>
-            `;
+            currentGoldenData = data;
+            const tabNames = [
+                ['overview', 'Overview'],
+                ['conversation', 'Conversation'],
+                ['metrics', 'Metrics'],
+                ['raw', 'Raw JSON']
+            ];
+            const tabs = el('div', 'tabs', ...tabNames.map(([name, label], index) => {
+                const tab = el('div', index === 0 ? 'tab active' : 'tab', label);
+                tab.dataset.tab = name;
+                tab.addEventListener('click', () => showTab(name));
+                return tab;
+            }));
             
-            const overviewTab = createOverviewTab(data);
-            const conversationTab = createConversationTab(data);
-            const metricsTab = createMetricsTab(data);
-            const rawTab = `<div class="tab-content" id="raw"><pre class="json-viewer">${JSON.stringify(data, null, 2)}</pre></div>`;
+            document.getElementById('goldenDetails').replaceChildren(
+                tabs,
+                ...tabNames.map(([name], index) => tabContent(name, index === 0))
+            );
+            renderTab('overview');
+        }
+        
+        // Fill a tab's content from currentGoldenData the first time it is shown
+        function renderTab(tabName) {
+            const content = document.getElementById(tabName);
+            if (!content || content.dataset.rendered) return;
             
-            detailsContainer.innerHTML = tabs + overviewTab + conversationTab + metricsTab + rawTab;
+            const renderers = {
+                overview: createOverviewTab,
+                conversation: createConversationTab,
+                metrics: createMetricsTab,
+                raw: createRawTab
+            };
+            content.append(...renderers[tabName](currentGoldenData));
+            content.dataset.rendered = '1';
         }
         
         function createOverviewTab(data) {
             const input = data.input || {};
             const output = data.golden_output || {};
             
-            return `
-                <div class="tab-content active" id="overview">
-                    <h3>Test: ${data.test_name}</h3>
-                    <p><strong>Provider:</strong> ${input.provider}</p>
-                    <p><strong>Model:</strong> ${input.model || 'Default'}</p>
-                    <p><strong>Recorded:</strong> ${data.recorded_at ? new Date(data.recorded_at).toLocaleString() : 'Unknown'}</p>
-                    
-                    <h4>Input</h4>
-                    <div class="message user">
-                        <div class="message-role">User Prompt</div>
-                        <div class="message-content">${input.user_prompt || 'No prompt'}</div>
-                    </div>
-                    
-                    <div class="message assistant">
-                        <div class="message-role">System Prompt</div>
-                        <div class="message-content">${(input.system_prompt || 'No system prompt').substring(0, 200)}${(input.system_prompt || '').length > 200 ? '...' : ''}</div>
-                    </div>
-                    
-                    <h4>Result</h4>
-                    <p><strong>Success:</strong> ${output.success ? '✅ Yes' : '❌ No'}</p>
-                    <p><strong>Summary:</strong> ${output.summary || 'No summary'}</p>
-                    ${output.final_result ? `<p><strong>Response:</strong> ${(output.final_result.response || 'No response').substring(0, 300)}${(output.final_result.response || '').length > 300 ? '...' : ''}</p>` : ''}
-                </div>
-            `;
+            return [
+                el('h3', null, `Test: ${data.test_name}`),
+                field('Provider', input.provider),
+                field('Model', input.model || 'Default'),
+                field('Recorded', data.recorded_at ? new Date(data.recorded_at).toLocaleString() : 'Unknown'),
+                
+                el('h4', null, 'Input'),
+                messageBlock('user', 'User Prompt', input.user_prompt || 'No prompt'),
+                messageBlock('assistant', 'System Prompt', truncate(input.system_prompt || 'No system prompt', 200)),
+                
+                el('h4', null, 'Result'),
+                field('Success', output.success ? '✅ Yes' : '❌ No'),
+                field('Summary', output.summary || 'No summary'),
+                output.final_result ? field('Response', truncate(output.final_result.response || 'No response', 300)) : null
+            ].filter(Boolean);
         }
         
         function createConversationTab(data) {
             const history = data.golden_output?.conversation_history || [];
             
-            let conversationHtml = '<div class="tab-content" id="conversation"><h3>Conversation Flow</h3>';
-            
             if (history.length === 0) {
-                conversationHtml += '<p>No conversation history available</p>';
-            } else {
-                history.forEach((message, index) => {
-                    const content = message.content || '[No content]';
-                    const toolCalls = message.tool_calls || [];
-                    
-                    conversationHtml += `
-                        <div class="message ${message.role}">
-                            <div class="message-role">${message.role}</div>
-                            <div class="message-content">${content}</div>
-                            ${toolCalls.length > 0 ? `
-                                <div class="tool-calls">
-                                    <strong>Tool Calls (${toolCalls.length}):</strong>
-                                    ${toolCalls.map(call => `
-                                        <div class="tool-call">
-                                            <strong>${call.function?.name || 'Unknown'}</strong>: ${call.function?.arguments || '{}'}
-                                        </div>
-                                    `).join('')}
-                                </div>
-                            ` : ''}
-                        </div>
-                    `;
-                });
+                return [
+                    el('h3', null, 'Conversation Flow'),
+                    el('p', null, 'No conversation history available')
+                ];
             }
             
-            conversationHtml += '</div>';
-            return conversationHtml;
+            return [
+                el('h3', null, 'Conversation Flow'),
+                ...history.map(message => {
+                    const toolCalls = message.tool_calls || [];
+                    const toolCallList = toolCalls.length > 0 ? el('div', 'tool-calls',
+                        el('strong', null, `Tool Calls (${toolCalls.length}):`),
+                        ...toolCalls.map(call => el('div', 'tool-call',
+                            el('strong', null, call.function?.name || 'Unknown'),
+                            `: ${call.function?.arguments || '{}'}`
+                        ))
+                    ) : null;
+                    
+                    return messageBlock(message.role, message.role, message.content || '[No content]', toolCallList);
+                })
+            ];
         }
         
         function createMetricsTab(data) {
             const metadata = data.golden_output?.execution_metadata || {};
             const providerResponses = data.provider_responses || [];
+            const metric = (value, label) => el('div', 'metric',
+                el('div', 'metric-value', `${value}`),
+                el('div', 'metric-label', label)
+            );
             
-            return `
-                <div class="tab-content" id="metrics">
-                    <h3>Performance Metrics</h3>
-                    
-                    <div class="metrics-grid">
-                        <div class="metric">
-                            <div class="metric-value">${metadata.total_execution_time || 'N/A'}</div>
-                            <div class="metric-label">Execution Time (s)</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value">${metadata.total_iterations || providerResponses.length}</div>
-                            <div class="metric-label">Total Iterations</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value">${metadata.success_rate || 'N/A'}</div>
-                            <div class="metric-label">Success Rate (%)</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value">${metadata.token_usage?.total_tokens || 'N/A'}</div>
-                            <div class="metric-label">Total Tokens</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value">${metadata.token_usage?.prompt_tokens || 'N/A'}</div>
-                            <div class="metric-label">Prompt Tokens</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value">${metadata.token_usage?.completion_tokens || 'N/A'}</div>
-                            <div class="metric-label">Completion Tokens</div>
-                        </div>
-                    </div>
-                    
-                    <h4>Provider Interactions</h4>
-                    ${providerResponses.map((response, index) => `
-                        <div style="background: #f8f9fa; padding: 10px; margin: 10px 0; border-radius: 4px;">
-                            <strong>Iteration ${response.iteration}</strong>
-                            <div style="font-size: 12px; color: #666; margin-top: 5px;">
-                                Tokens: ${response.token_usage?.total_tokens || 'N/A'} 
-                                (${response.token_usage?.prompt_tokens || 0} prompt + ${response.token_usage?.completion_tokens || 0} completion)
-                            </div>
-                        </div>
-                    `).join('')}
-                </div>
-            `;
+            return [
+                el('h3', null, 'Performance Metrics'),
+                el('div', 'metrics-grid',
+                    metric(metadata.total_execution_time || 'N/A', 'Execution Time (s)'),
+                    metric(metadata.total_iterations || providerResponses.length, 'Total Iterations'),
+                    metric(metadata.success_rate || 'N/A', 'Success Rate (%)'),
+                    metric(metadata.token_usage?.total_tokens || 'N/A', 'Total Tokens'),
+                    metric(metadata.token_usage?.prompt_tokens || 'N/A', 'Prompt Tokens'),
+                    metric(metadata.token_usage?.completion_tokens || 'N/A', 'Completion Tokens')
+                ),
+                
+                el('h4', null, 'Provider Interactions'),
+                ...providerResponses.map(response => el('div', 'interaction',
+                    el('strong', null, `Iteration ${response.iteration}`),
+                    el('div', 'interaction-tokens',
+                        `Tokens: ${response.token_usage?.total_tokens || 'N/A'} ` +
+                        `(${response.token_usage?.prompt_tokens || 0} prompt + ${response.token_usage?.completion_tokens || 0} completion)`
+                    )
+                ))
+            ];
+        }
+        
+        // The full pretty-print is the most expensive part of a selection, so only do it on demand
+        function createRawTab(data) {
+            return [el('pre', 'json-viewer', JSON.stringify(data, null, 2))];
         }
         
         function showTab(tabName) {
             // Update tab buttons
-            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-            event.target.classList.add('active');
+            document.querySelectorAll('.tab').forEach(tab => tab.classList.toggle('active', tab.dataset.tab === tabName));
             
             // Update tab content
-            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-            document.getElementById(tabName).classList.add('active');
+            renderTab(tabName);
+            document.querySelectorAll('.tab-content').forEach(content => content.classList.toggle('active', content.id === tabName));
         }
         
         // Initialize the page
@@ -463,7 +711,217 @@ class GoldenViewerHandler(SimpleHTTPRequestHandler):
         });
     </script>
 </body>
-</html>'''
+</html>'''.replace('__CSS_VERSION__', _CSS_VERSION)
+_INDEX_BYTES = INDEX_HTML.encode('utf-8')
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES)
+
+
+# Cap on concurrently handled requests
+MAX_REQUEST_THREADS = 32
+
+
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that caps how many request threads run at once."""
+    
+    def __init__(self, server_address, handler_class, max_threads=MAX_REQUEST_THREADS):
+        super().__init__(server_address, handler_class)
+        self._slots = threading.BoundedSemaphore(max_threads)
+    
+    def process_request(self, request, client_address):
+        # Blocks the accept loop while all slots are busy
+        self._slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+
+class GoldenViewerHandler(SimpleHTTPRequestHandler):
+    """Custom handler for serving golden test viewer."""
+    
+    # Buffer wfile (the base class default is unbuffered), so the header
+    # block and a small body go out in one send when the request finishes
+    wbufsize = -1
+    
+    def __init__(self, *args, **kwargs):
+        self.goldens_dir = Path(__file__).parent / "goldens"
+        super().__init__(*args, **kwargs)
+    
+    def do_GET(self):
+        """Handle GET requests."""
+        parsed_url = urlparse(self.path)
+        
+        if parsed_url.path == "/" or parsed_url.path == "/index.html":
+            self.serve_index()
+        elif parsed_url.path == "/static/viewer.css":
+            self.serve_css()
+        elif parsed_url.path == "/api/goldens":
+            self.serve_golden_list(parsed_url.query)
+        elif parsed_url.path.startswith("/api/golden/"):
+            self.serve_golden_file(parsed_url.path[12:])  # Remove /api/golden/
+        elif parsed_url.path == "/api/providers":
+            self.serve_provider_stats()
+        else:
+            super().do_GET()
+    
+    def serve_index(self):
+        """Serve the main HTML interface (pre-encoded at import time)."""
+        self.send_body(
+            _INDEX_BYTES,
+            'text/html; charset=utf-8',
+            {'Cache-Control': 'public, max-age=60'},
+            gzipped=_INDEX_GZIP
+        )
+    
+    def serve_css(self):
+        """Serve the viewer stylesheet; its URL is versioned, so it can be cached forever."""
+        self.send_body(
+            _CSS_BYTES,
+            'text/css; charset=utf-8',
+            {'Cache-Control': 'public, max-age=31536000, immutable'},
+            gzipped=_CSS_GZIP
+        )
+    
+    def serve_golden_list(self, query=""):
+        """
+        Serve list of all golden files.
+        
+        With ``?offset=&limit=`` only that page is returned, wrapped as
+        ``{"goldens": [...], "total", "offset", "limit", "fingerprint"}``;
+        clients compare fingerprints to notice the list changed between pages.
+        """
+        scan = _current_scan(self.goldens_dir)
+        goldens = scan.goldens
+        params = parse_qs(query)
+        if "offset" not in params and "limit" not in params:
+            self.send_json_bytes(scan.goldens_body, scan.etag)
+            return
+        
+        try:
+            offset = max(0, int(params.get("offset", ["0"])[0]))
+            limit = max(0, int(params.get("limit", [str(GOLDEN_PAGE_SIZE)])[0]))
+        except ValueError:
+            self.send_error(400, "offset and limit must be integers")
+            return
+        
+        self.send_json_response({
+            "goldens": goldens[offset:offset + limit],
+            "total": len(goldens),
+            "offset": offset,
+            "limit": limit,
+            "fingerprint": scan.fingerprint
+        }, scan.etag)
+    
+    def serve_golden_file(self, file_path):
+        """Serve a specific golden file, streaming its bytes straight from disk."""
+        golden_path = (self.goldens_dir / file_path).resolve()
+        # Only JSON files inside goldens_dir; "../" must not reach .env and friends
+        if (not golden_path.is_relative_to(self.goldens_dir.resolve())
+                or golden_path.suffix != ".json" or not golden_path.is_file()):
+            self.send_error(404, f"Golden file not found: {file_path}")
+            return
+        
+        try:
+            f = golden_path.open('rb')
+        except IOError as e:
+            self.send_error(500, f"Error reading golden file: {e}")
+            return
+        
+        # The page pretty-prints client-side, so there's no need to parse and re-serialize
+        with f:
+            st = os.fstat(f.fileno())
+            etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if self.is_not_modified(etag):
+                self.send_not_modified(etag)
+                return
+            
+            headers = {
+                'ETag': etag,
+                'Last-Modified': self.date_time_string(st.st_mtime),
+                'Cache-Control': 'no-cache'
+            }
+            if st.st_size > GZIP_MIN_SIZE and self.accepts_gzip():
+                self.send_body(f.read(), 'application/json', headers)
+                return
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', st.st_size)
+            self.end_headers()
+            self.copyfile(f, self.wfile)
+    
+    def serve_provider_stats(self):
+        """Serve provider statistics."""
+        scan = _current_scan(self.goldens_dir)
+        self.send_json_bytes(scan.stats_body, scan.etag)
+    
+    def is_not_modified(self, etag):
+        """True if the client's If-None-Match already names *etag*."""
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or etag in tags
+    
+    def send_not_modified(self, etag):
+        """Send an empty 304 response."""
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.end_headers()
+    
+    def accepts_gzip(self):
+        """True if the client accepts gzip-encoded responses."""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+    
+    def send_body(self, body, content_type, headers=None, gzipped=None):
+        """
+        Send a 200 response with *body*, gzipped when the client allows it.
+        
+        Pass *gzipped* to reuse an already-compressed copy of a constant body.
+        """
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Vary', 'Accept-Encoding')
+        if len(body) > GZIP_MIN_SIZE and self.accepts_gzip():
+            body = gzipped if gzipped is not None else gzip.compress(body, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', len(body))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_json_response(self, data, etag=None):
+        """Send JSON response, or 304 if the client's copy (by *etag*) is current."""
+        if etag is not None and self.is_not_modified(etag):
+            self.send_not_modified(etag)
+            return
+        
+        self.send_json_bytes(_dumps(data), etag)
+    
+    def send_json_bytes(self, body, etag=None):
+        """Send already-serialized JSON, or 304 if the client's copy (by *etag*) is current."""
+        if etag is not None and self.is_not_modified(etag):
+            self.send_not_modified(etag)
+            return
+        
+        # no-cache: browsers may keep the body but must revalidate it by ETag
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'} if etag is not None else None
+        self.send_body(body, 'application/json', headers)
+    
+    def generate_html(self):
+        """Generate the main HTML interface."""
+        return INDEX_HTML
 
 
 def main():
@@ -472,13 +930,19 @@ def main():
     parser.add_argument('--port', type=int, default=8080, help='Port to serve on (default: 8080)')
     parser.add_argument('--host', default='localhost', help='Host to bind to (default: localhost)')
     parser.add_argument('--no-browser', action='store_true', help='Don\'t automatically open browser')
+    parser.add_argument('--rescan-interval', type=float, default=RESCAN_INTERVAL,
+                        help=f'Seconds between background rescans of goldens/; 0 scans per request (default: {RESCAN_INTERVAL})')
     
     args = parser.parse_args()
     
     # Change to the tests directory to serve static files
     os.chdir(Path(__file__).parent)
     
-    server = HTTPServer((args.host, args.port), GoldenViewerHandler)
+    if args.rescan_interval > 0:
+        start_golden_watcher(Path(__file__).parent / "goldens", args.rescan_interval)
+    
+    # One thread per request (up to a cap), so the page's parallel API fetches don't queue
+    server = BoundedThreadingHTTPServer((args.host, args.port), GoldenViewerHandler)
     
     url = f"http://{args.host}:{args.port}"
     print(f"🚀 Starting MCP-Ghost Golden Test Viewer")
@@ -487,7 +951,6 @@ def main():
     print(f"⏹️  Press Ctrl+C to stop")
     
     # Start server in a separate thread so we can open browser after it's ready
-    import threading
     import time
     
     def start_server():
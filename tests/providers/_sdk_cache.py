@@ -0,0 +1,19 @@
+"""Import-once lookup of the optional provider client classes for tests."""
+import functools
+import importlib
+
+_CLIENT_CLASSES = {
+    "openai": ("mcp_ghost.providers.openai_client", "OpenAILLMClient"),
+    "anthropic": ("mcp_ghost.providers.anthropic_client", "AnthropicLLMClient"),
+    "gemini": ("mcp_ghost.providers.gemini_client", "GeminiLLMClient"),
+}
+
+
+@functools.cache
+def client_class(name):
+    """Return the client class for ``name``, or None if its SDK isn't installed."""
+    module_name, class_name = _CLIENT_CLASSES[name]
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except ImportError:
+        return None
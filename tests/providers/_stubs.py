@@ -0,0 +1,21 @@
+"""Lightweight stand-ins for Anthropic SDK response objects."""
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ToolUseBlock:
+    type: str
+    id: str
+    name: str
+    input: dict
+
+
+@dataclass(slots=True)
+class TextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass(slots=True)
+class Response:
+    content: list = field(default_factory=list)
@@ -0,0 +1,96 @@
+"""Tests for Gemini LLM client."""
+import itertools
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_ghost.providers.gemini_client import GeminiLLMClient
+
+SYSTEM_MESSAGES = [
+    {"role": "system", "content": "You are a test assistant"},
+    {"role": "user", "content": "Hello"},
+]
+
+
+@pytest.fixture
+def gemini_client(monkeypatch):
+    """Gemini client whose SDK is a Mock; caches.create returns a named cache."""
+    monkeypatch.setattr("mcp_ghost.providers.gemini_client.genai.Client", Mock())
+    client = GeminiLLMClient(api_key="test-key")
+    names = itertools.count()
+    client.client.caches.create.side_effect = lambda **_: SimpleNamespace(name=f"cachedContents/{next(names)}")
+    return client
+
+
+class TestGeminiContextCache:
+    """Test the client-side registry of Gemini context caches."""
+    
+    def test_content_cache_is_reused(self, gemini_client):
+        """Test that the same prefix maps to one cachedContent."""
+        first = gemini_client._cached_content("System prompt", [], None)
+        second = gemini_client._cached_content("System prompt", [], None)
+        
+        assert first == second
+        assert gemini_client.client.caches.create.call_count == 1
+    
+    def test_content_cache_is_bounded(self, gemini_client, monkeypatch):
+        """Test that least recently used prefixes are evicted past CACHE_MAX_ENTRIES."""
+        monkeypatch.setattr(GeminiLLMClient, "CACHE_MAX_ENTRIES", 2)
+        
+        for prompt in ("a", "b", "a", "c"):
+            gemini_client._cached_content(prompt, [], None)
+        
+        assert len(gemini_client._content_caches) == 2
+        # "b" was least recently used, so asking for it again creates a new cache
+        gemini_client._cached_content("b", [], None)
+        assert gemini_client.client.caches.create.call_count == 4
+    
+    def test_expired_content_cache_is_dropped(self, gemini_client, monkeypatch):
+        """Test that an expired entry is replaced rather than kept alongside."""
+        monkeypatch.setattr(GeminiLLMClient, "CACHE_TTL_SECONDS", 0)
+        
+        first = gemini_client._cached_content("System prompt", [], None)
+        second = gemini_client._cached_content("System prompt", [], None)
+        
+        assert first != second
+        assert len(gemini_client._content_caches) == 1
+
+
+class TestGeminiStreaming:
+    """Test the streaming path of the Gemini client."""
+    
+    @pytest.mark.asyncio
+    async def test_stream_creates_context_cache_off_the_event_loop(self, gemini_client):
+        """Test that the (blocking) caches.create call runs on a worker thread."""
+        loop_thread = threading.current_thread()
+        create_threads = []
+        
+        def create(**_):
+            create_threads.append(threading.current_thread())
+            return SimpleNamespace(name="cachedContents/abc")
+        
+        gemini_client.client.caches.create.side_effect = create
+        gemini_client.client.models.generate_content_stream.return_value = iter([
+            SimpleNamespace(text="Hi", candidates=None),
+        ])
+        
+        stream = await gemini_client.create_completion(SYSTEM_MESSAGES, stream=True)
+        deltas = [delta async for delta in stream]
+        
+        assert [d["response"] for d in deltas] == ["Hi"]
+        assert create_threads and create_threads[0] is not loop_thread
+        config = gemini_client.client.models.generate_content_stream.call_args.kwargs["config"]
+        assert config.cached_content == "cachedContents/abc"
+    
+    @pytest.mark.asyncio
+    async def test_stream_raises_sdk_errors(self, gemini_client):
+        """Test that an error from generate_content_stream surfaces from the stream."""
+        gemini_client.client.models.generate_content_stream.side_effect = RuntimeError("quota exceeded")
+        
+        stream = await gemini_client.create_completion(SYSTEM_MESSAGES, stream=True)
+        
+        with pytest.raises(RuntimeError, match="quota exceeded"):
+            async for _ in stream:
+                pass
@@ -62,6 +62,29 @@ class TestMCPGhostConfig:
         assert config.max_iterations == 10
         assert config.enable_backtracking is True
         assert config.conversation_memory is True
+    
+    def test_config_is_frozen_and_hashable(self):
+        """Test that configs are immutable and usable as dict keys."""
+        from dataclasses import FrozenInstanceError, replace
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="System",
+            provider="openai",
+            api_key="key",
+            user_prompt="User"
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            config.user_prompt = "Other"
+        
+        same = replace(config)
+        other = replace(config, user_prompt="Other")
+        lookup = {config: "cached"}
+        
+        assert lookup[same] == "cached"
+        assert other not in lookup
+        assert other.content_digest != config.content_digest
 
 
 class TestMCPGhostResult:
@@ -115,6 +138,23 @@ class TestMCPGhostResult:
         assert result.tool_chain[0]["tool_name"] == "test_tool"
         assert result.tool_chain[0]["success"] is True
 
+    
+    def test_token_usage_accumulates_in_place(self):
+        """Test that TokenUsage sums per-call usage dicts, ignoring missing keys."""
+        import dataclasses
+        from mcp_ghost.core import TokenUsage
+        
+        usage = TokenUsage()
+        usage.add({"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15})
+        usage.add({"prompt_tokens": 20, "total_tokens": 20, "cache_read_input_tokens": 7})
+        
+        assert dataclasses.asdict(usage) == {
+            "prompt_tokens": 30,
+            "completion_tokens": 5,
+            "total_tokens": 35,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 7
+        }
 
 class TestMCPGhostMainFunction:
     """Test the main mcp_ghost function interface."""
@@ -220,6 +260,141 @@ class TestMCPGhostMainFunction:
         assert len(result.errors) > 0
 
 
+    @pytest.mark.asyncio
+    async def test_mcp_ghost_aggregates_reported_token_usage(self):
+        """Test that provider-reported usage, including prompt-cache tokens, is summed."""
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="anthropic",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": [],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                    "cache_creation_input_tokens": 0,
+                    "cache_read_input_tokens": 1200
+                }
+            }
+            mock_get_client.return_value = mock_client
+            
+            result = await mcp_ghost(config)
+        
+        token_usage = result.execution_metadata["token_usage"]
+        assert token_usage["total_tokens"] == 15
+        assert token_usage["cache_read_input_tokens"] == 1200
+        assert token_usage["cache_creation_input_tokens"] == 0
+
+
+    @pytest.mark.asyncio
+    async def test_mcp_ghost_reuses_provider_client(self):
+        """Test that the LLM client is built once and shared across calls."""
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": []
+            }
+            mock_get_client.return_value = mock_client
+            
+            await mcp_ghost(config)
+            await mcp_ghost(config)
+        
+        assert mock_get_client.call_count == 1
+        assert mock_client.create_completion.call_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_mcp_ghost_retries_rate_limited_completion(self):
+        """Test that a 429 from the provider is retried after retry-after."""
+        class RateLimited(Exception):
+            status_code = 429
+            response = Mock(headers={"retry-after": "0"})
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.side_effect = [
+                RateLimited("slow down"),
+                {"response": "Test response", "tool_calls": []}
+            ]
+            mock_get_client.return_value = mock_client
+            
+            result = await mcp_ghost(config)
+        
+        assert mock_client.create_completion.call_count == 2
+        assert result.success is True
+        assert result.errors == []
+        assert result.final_result == "Test response"
+
+
+    @pytest.mark.asyncio
+    async def test_mcp_ghost_connects_servers_concurrently(self):
+        """Test that servers connect in parallel and failures are recorded per server."""
+        import asyncio
+        
+        in_flight = 0
+        peak = 0
+        
+        async def fake_connect(server_name, server_config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if server_name == "broken":
+                raise ConnectionError("spawn failed")
+            return [{"name": f"{server_name}_tool", "description": "", "parameters": {}, "server": server_name}]
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {"first": {}, "broken": {}, "second": {}}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        
+        with patch('mcp_ghost.core._connect_to_mcp_server', side_effect=fake_connect), \
+             patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": []
+            }
+            mock_get_client.return_value = mock_client
+            
+            result = await mcp_ghost(config)
+        
+        assert peak == 3
+        assert result.execution_metadata["servers_connected"] == 2
+        assert result.execution_metadata["tools_discovered"] == 2
+        assert [e["tool_name"] for e in result.errors] == ["mcp_connection"]
+        assert "broken" in result.errors[0]["error"]
+
+
 class TestMCPGhostIntegrationInterface:
     """Test MCP-Ghost integration points."""
     
@@ -268,6 +443,17 @@ class TestMCPGhostIntegrationInterface:
         for field in expected_fields:
             assert field in fields
 
+    
+    def test_core_dataclasses_are_slotted(self):
+        """Test that the per-call dataclasses don't carry a per-instance __dict__."""
+        from mcp_ghost.core import ToolCallInfo
+        
+        result = MCPGhostResult(success=True)
+        tool_call = ToolCallInfo(iteration=1, tool_name="t", arguments={}, success=True)
+        
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(tool_call, "__dict__")
+        assert "server_config" in MCPGhostConfig.__slots__
 
 class TestMCPGhostProviderIntegration:
     """Test MCP-Ghost provider integration interface."""
@@ -311,4 +497,284 @@ class TestMCPGhostProviderIntegration:
         )
         
         # Should create config successfully, validation happens at runtime
-        assert config.provider == "invalid_provider"
\ No newline at end of file
+        assert config.provider == "invalid_provider"
+
+class TestMCPGhostResponseCache:
+    """Test the mcp_ghost response cache."""
+    
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        from mcp_ghost import core
+        monkeypatch.setattr(core, "_cache", core._LLMCache())
+    
+    @staticmethod
+    def _config(**overrides):
+        values = dict(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test prompt",
+            conversation_memory=False,
+        )
+        values.update(overrides)
+        return MCPGhostConfig(**values)
+    
+    @pytest.mark.asyncio
+    async def test_repeated_stateless_call_is_cached(self):
+        """Test that identical stateless configs hit the cache."""
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": []
+            }
+            mock_get_client.return_value = mock_client
+            
+            first = await mcp_ghost(self._config())
+            second = await mcp_ghost(self._config())
+        
+        assert mock_client.create_completion.call_count == 1
+        assert second.final_result == first.final_result
+        assert second is not first
+        assert second.execution_metadata["cache"] == {"hits": 1, "misses": 1}
+    
+    @pytest.mark.asyncio
+    async def test_run_with_errors_is_not_cached(self):
+        """Test that a run that recorded errors is retried rather than served from cache."""
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.side_effect = [
+                Exception("network down"),
+                {"response": "Recovered", "tool_calls": []},
+            ]
+            mock_get_client.return_value = mock_client
+            
+            first = await mcp_ghost(self._config())
+            second = await mcp_ghost(self._config())
+        
+        # Backtracking (the default) keeps success=True despite the error
+        assert first.success is True
+        assert first.errors[0]["error"] == "network down"
+        assert second.final_result == "Recovered"
+        assert not second.errors
+        assert mock_client.create_completion.call_count == 2
+        assert second.execution_metadata["cache"] == {"hits": 0, "misses": 2}
+    
+    @pytest.mark.asyncio
+    async def test_temperature_is_sent_to_provider(self):
+        """Test that config.temperature reaches create_completion, not just the cache check."""
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": []
+            }
+            mock_get_client.return_value = mock_client
+            
+            await mcp_ghost(self._config(temperature=0.7))
+        
+        assert mock_client.create_completion.call_args.kwargs["temperature"] == 0.7
+    
+    @pytest.mark.asyncio
+    async def test_stateful_or_sampled_calls_bypass_cache(self):
+        """Test that conversation memory or temperature > 0 disables caching."""
+        with patch('mcp_ghost.core.get_llm_client') as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.create_completion.return_value = {
+                "response": "Test response",
+                "tool_calls": []
+            }
+            mock_get_client.return_value = mock_client
+            
+            for config in (self._config(conversation_memory=True), self._config(temperature=0.7)):
+                await mcp_ghost(config)
+                await mcp_ghost(config)
+        
+        assert mock_client.create_completion.call_count == 4
+    
+    def test_cache_key_ignores_api_key(self):
+        """Test that the cache key depends on request content, not credentials."""
+        from mcp_ghost.core import _LLMCache
+        
+        key_a = _LLMCache.cache_key(self._config(api_key="a"))
+        key_b = _LLMCache.cache_key(self._config(api_key="b"))
+        key_c = _LLMCache.cache_key(self._config(user_prompt="Other"))
+        
+        assert key_a == key_b
+        assert key_a != key_c
+    
+    def test_cache_key_without_optional_speedups(self, monkeypatch):
+        """Test that the stdlib fallback produces a stable 128-bit key."""
+        from mcp_ghost import core
+        
+        monkeypatch.setattr(core, "orjson", None)
+        monkeypatch.setattr(core, "blake3", None)
+        
+        key = core._LLMCache.cache_key(self._config())
+        assert key == core._LLMCache.cache_key(self._config())
+        assert len(key) == 32
+
+
+class TestMCPGhostStream:
+    """Test streaming the final response via mcp_ghost_stream."""
+    
+    @staticmethod
+    def _streaming_client(*turns):
+        """Fake client whose streamed completions replay *turns* (lists of deltas; exceptions are raised)."""
+        pending = list(turns)
+        
+        async def replay(deltas):
+            for delta in deltas:
+                if isinstance(delta, BaseException):
+                    raise delta
+                yield delta
+        
+        async def create_completion(messages, tools=None, *, stream=False, temperature=None):
+            assert stream is True
+            return replay(pending.pop(0))
+        
+        client = Mock()
+        client.create_completion = AsyncMock(side_effect=create_completion)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_stream_yields_text_deltas(self):
+        """Test that text is yielded chunk by chunk as the provider streams it."""
+        from mcp_ghost import mcp_ghost_stream
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        client = self._streaming_client([
+            {"response": "Hello", "tool_calls": []},
+            {"response": ", world", "tool_calls": []},
+        ])
+        
+        with patch('mcp_ghost.core.get_llm_client', return_value=client):
+            chunks = [chunk async for chunk in mcp_ghost_stream(config)]
+        
+        assert chunks == ["Hello", ", world"]
+    
+    @pytest.mark.asyncio
+    async def test_stream_raises_when_run_fails(self):
+        """Test that a failed run ends the stream with an error, not silently."""
+        from mcp_ghost import mcp_ghost_stream
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test",
+            enable_backtracking=False
+        )
+        client = Mock()
+        client.create_completion = AsyncMock(side_effect=Exception("invalid api key"))
+        
+        with patch('mcp_ghost.core.get_llm_client', return_value=client):
+            with pytest.raises(RuntimeError, match="invalid api key"):
+                async for _ in mcp_ghost_stream(config):
+                    pass
+    
+    @pytest.mark.asyncio
+    async def test_stream_completes_after_recovered_tool_error(self):
+        """Test that a tool error recovered by backtracking doesn't fail the stream."""
+        from mcp_ghost import mcp_ghost_stream
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="openai",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        client = self._streaming_client(
+            [{"response": "", "tool_calls": [{"index": 0, "id": "call_1", "type": "function",
+                                             "function": {"name": "test.read", "arguments": "{}"}}]}],
+            [{"response": "Recovered", "tool_calls": []}],
+        )
+        
+        with patch('mcp_ghost.core.get_llm_client', return_value=client), \
+             patch('mcp_ghost.core._execute_tool_call', AsyncMock(side_effect=Exception("boom"))):
+            chunks = [chunk async for chunk in mcp_ghost_stream(config)]
+        
+        assert chunks == ["Recovered"]
+    
+    @staticmethod
+    def _rate_limited():
+        error = Exception("slow down")
+        error.status_code = 429
+        error.response = Mock(headers={"retry-after": "0"})
+        return error
+    
+    @pytest.mark.asyncio
+    async def test_stream_retries_rate_limit_before_first_chunk(self):
+        """Test that a 429 raised before any text is sent is retried."""
+        from mcp_ghost import core
+        
+        client = self._streaming_client(
+            [self._rate_limited()],
+            [{"response": "Hello", "tool_calls": []}],
+        )
+        chunks = []
+        
+        result = await core._create_completion(client, "openai", on_text=chunks.append, messages=[])
+        
+        assert chunks == ["Hello"]
+        assert result["response"] == "Hello"
+        assert client.create_completion.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_stream_does_not_retry_after_text_was_sent(self):
+        """Test that a 429 mid-stream is raised rather than replaying sent text."""
+        from mcp_ghost import core
+        
+        client = self._streaming_client(
+            [{"response": "Hel", "tool_calls": []}, self._rate_limited()],
+            [{"response": "Hello", "tool_calls": []}],
+        )
+        chunks = []
+        
+        with pytest.raises(Exception, match="slow down"):
+            await core._create_completion(client, "openai", on_text=chunks.append, messages=[])
+        
+        assert chunks == ["Hel"]
+        assert client.create_completion.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_stream_assembles_fragmented_tool_calls(self):
+        """Test that indexed tool-call fragments are merged before execution."""
+        from mcp_ghost import core
+        
+        config = MCPGhostConfig(
+            server_config={"mcpServers": {}},
+            system_prompt="Test",
+            provider="anthropic",
+            api_key="test-key",
+            user_prompt="Test"
+        )
+        client = self._streaming_client(
+            [
+                {"response": "", "tool_calls": [{"index": 0, "id": "toolu_1", "type": "function",
+                                                 "function": {"name": "test.read", "arguments": ""}}]},
+                {"response": "", "tool_calls": [{"index": 0, "function": {"arguments": '{"path": '}}]},
+                {"response": "", "tool_calls": [{"index": 0, "function": {"arguments": '"a.txt"}'}}]},
+            ],
+            [{"response": "Done", "tool_calls": []}],
+        )
+        chunks = []
+        
+        with patch('mcp_ghost.core.get_llm_client', return_value=client), \
+             patch('mcp_ghost.core._execute_tool_call', AsyncMock(return_value="contents")) as mock_execute:
+            result = await core._run_mcp_ghost(config, on_text=chunks.append)
+        
+        assert chunks == ["Done"]
+        assert mock_execute.call_args.args[3] == {"path": "a.txt"}
+        assert result.tool_chain[0].tool_name == "test.read"
+        assert result.conversation_history[2]["tool_calls"][0]["id"] == "toolu_1"
+        assert result.final_result == "Done"
@@ -11,15 +11,12 @@ import sqlite3
 import tempfile
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 from mcp_ghost.core import mcp_ghost, MCPGhostConfig, MCPGhostResult
 from tests.goldens.golden_framework import GoldenRecorder, MockLLMClient
 
-# Load environment variables for testing
-load_dotenv()
-
 
+@pytest.mark.live
 class TestGoldenE2ECRUD:
     """Golden tests for end-to-end CRUD operations."""
     
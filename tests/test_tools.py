@@ -322,7 +322,7 @@ class TestToolsIntegration:
         
         # 4. Create execution result
         execution_result = ToolCallResult(
-            tool_name=f"{tool.namespace}.{tool.name}",
+            tool_name=tool.qualified_name,
             success=True,
             result={"rows": [{"id": 1, "name": "test"}]}
         )
@@ -277,4 +277,47 @@ class TestSystemPromptGeneratorEdgeCases:
         # Should handle Unicode properly
         assert "测试工具" in result
         assert "🛠️" in result
-        assert "🤖" in result
\ No newline at end of file
+        assert "🤖" in result
+
+class TestJsonUtils:
+    """Test the hot-path JSON helpers."""
+    
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def json_utils(self, request, monkeypatch):
+        from mcp_ghost.utils import json_utils
+        if request.param == "stdlib":
+            monkeypatch.setattr(json_utils, "orjson", None)
+        elif json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        return json_utils
+    
+    def test_round_trip(self, json_utils):
+        """Test that dumps/loads round-trip and keep non-ASCII text."""
+        data = {"name": "测试", "rows": [1, 2.5, None, True]}
+        
+        text = json_utils.dumps(data, indent=True)
+        
+        assert "测试" in text
+        assert json_utils.loads(text) == data
+        assert json_utils.loads(text.encode("utf-8")) == data
+    
+    def test_default_handles_unserializable(self, json_utils):
+        """Test that the default hook is used for unknown types."""
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+        
+        assert json_utils.loads(json_utils.dumps({"v": Opaque()}, default=str)) == {"v": "opaque"}
+    
+    def test_wide_integers_fall_back_to_stdlib(self, json_utils):
+        """Test that values orjson can't encode still serialize."""
+        assert json_utils.loads(json_utils.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+    
+    def test_compact_output_matches_across_encoders(self, json_utils):
+        """Test that compact output is identical with orjson, stdlib and the wide-int fallback."""
+        assert json_utils.dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+        assert json_utils.dumps({"big": 2 ** 70, "b": [1]}) == '{"big":%d,"b":[1]}' % 2 ** 70
+    
+    def test_indented_output_matches_across_encoders(self, json_utils):
+        """Test that indented output is identical with orjson and stdlib."""
+        assert json_utils.dumps({"a": 1, "b": [1, 2]}, indent=True) == '{\n  "a": 1,\n  "b": [\n    1,\n    2\n  ]\n}'
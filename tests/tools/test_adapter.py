@@ -1,123 +1,77 @@
 """Tests for tool name adapter."""
+import re
+
 import pytest
 from mcp_ghost.tools.adapter import ToolNameAdapter
 from mcp_ghost.tools.models import ToolInfo
 
+OPENAI_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+LONG_NAMESPACE = "a" * 100
+LONG_NAME = "b" * 100
+
 
 class TestToolNameAdapter:
     """Test the ToolNameAdapter class."""
     
-    def test_to_openai_compatible_basic(self):
-        """Test basic OpenAI-compatible name conversion."""
-        result = ToolNameAdapter.to_openai_compatible("sqlite", "list_tables")
-        assert result == "sqlite_list_tables"
-        
-        result = ToolNameAdapter.to_openai_compatible("filesystem", "read_file")
-        assert result == "filesystem_read_file"
-    
-    def test_to_openai_compatible_with_invalid_chars(self):
-        """Test OpenAI name conversion with invalid characters."""
-        # Test with dots
-        result = ToolNameAdapter.to_openai_compatible("my.namespace", "tool.name")
-        assert result == "my_namespace_tool_name"
-        
-        # Test with special characters
-        result = ToolNameAdapter.to_openai_compatible("ns@special", "tool#name!")
-        assert result == "ns_special_tool_name_"
-        
-        # Test with spaces
-        result = ToolNameAdapter.to_openai_compatible("my namespace", "tool name")
-        assert result == "my_namespace_tool_name"
-    
-    def test_to_openai_compatible_regex_compliance(self):
+    @pytest.mark.parametrize("convert,namespace,name,expected", [
+        (ToolNameAdapter.to_openai_compatible, "sqlite", "list_tables", "sqlite_list_tables"),
+        (ToolNameAdapter.to_openai_compatible, "filesystem", "read_file", "filesystem_read_file"),
+        (ToolNameAdapter.to_openai_compatible, "my.namespace", "tool.name", "my_namespace_tool_name"),
+        (ToolNameAdapter.to_openai_compatible, "ns@special", "tool#name!", "ns_special_tool_name_"),
+        (ToolNameAdapter.to_openai_compatible, "my namespace", "tool name", "my_namespace_tool_name"),
+        # Anthropic allows dots, so the original format is preserved
+        (ToolNameAdapter.to_anthropic_compatible, "sqlite", "list_tables", "sqlite.list_tables"),
+        (ToolNameAdapter.to_anthropic_compatible, "filesystem", "read_file", "filesystem.read_file"),
+        (ToolNameAdapter.to_gemini_compatible, "sqlite", "list_tables", "sqlite_list_tables"),
+        (ToolNameAdapter.to_gemini_compatible, "ns.special", "tool@name", "ns_special_tool_name"),
+    ], ids=[
+        "openai-basic", "openai-basic-2", "openai-dots", "openai-special-chars", "openai-spaces",
+        "anthropic-basic", "anthropic-basic-2", "gemini-basic", "gemini-special-chars",
+    ])
+    def test_to_provider_compatible(self, convert, namespace, name, expected):
+        """Test provider-specific name conversion."""
+        assert convert(namespace, name) == expected
+    
+    @pytest.mark.parametrize("namespace,name", [
+        ("sqlite", "list_tables"),
+        ("complex.namespace", "complex-tool@name"),
+        ("123numeric", "tool$with%symbols"),
+        ("unicode🔧", "tool✨name"),
+    ])
+    def test_to_openai_compatible_regex_compliance(self, namespace, name):
         """Test that OpenAI names match the required regex pattern."""
-        import re
-        openai_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-        
-        test_cases = [
-            ("sqlite", "list_tables"),
-            ("complex.namespace", "complex-tool@name"),
-            ("123numeric", "tool$with%symbols"),
-            ("unicode🔧", "tool✨name"),
-        ]
-        
-        for namespace, name in test_cases:
-            result = ToolNameAdapter.to_openai_compatible(namespace, name)
-            # This will fail initially if regex isn't properly implemented
-            assert openai_pattern.match(result), f"'{result}' doesn't match OpenAI pattern"
-    
-    def test_to_anthropic_compatible(self):
-        """Test Anthropic-compatible name conversion."""
-        result = ToolNameAdapter.to_anthropic_compatible("sqlite", "list_tables")
-        # Anthropic allows dots, so should preserve original format
-        assert result == "sqlite.list_tables"
-        
-        result = ToolNameAdapter.to_anthropic_compatible("filesystem", "read_file")
-        assert result == "filesystem.read_file"
-    
-    def test_to_gemini_compatible(self):
-        """Test Gemini-compatible name conversion."""
-        result = ToolNameAdapter.to_gemini_compatible("sqlite", "list_tables")
-        assert result == "sqlite_list_tables"
-        
-        # Test with special characters
-        result = ToolNameAdapter.to_gemini_compatible("ns.special", "tool@name")
-        # This will fail initially until proper Gemini sanitization is implemented
-        assert result == "ns_special_tool_name"
-    
-    def test_from_openai_compatible_basic(self):
-        """Test converting OpenAI names back to MCP format."""
-        result = ToolNameAdapter.from_openai_compatible("sqlite_list_tables")
-        assert result == "sqlite.list_tables"
-        
-        result = ToolNameAdapter.from_openai_compatible("filesystem_read_file")
-        assert result == "filesystem.read_file"
+        result = ToolNameAdapter.to_openai_compatible(namespace, name)
+        assert OPENAI_NAME_RE.match(result), f"'{result}' doesn't match OpenAI pattern"
     
-    def test_from_openai_compatible_no_underscore(self):
-        """Test converting OpenAI names without underscore."""
-        result = ToolNameAdapter.from_openai_compatible("simple_tool")
-        assert result == "simple.tool"
-        
+    @pytest.mark.parametrize("openai_name,expected", [
+        ("sqlite_list_tables", "sqlite.list_tables"),
+        ("filesystem_read_file", "filesystem.read_file"),
+        ("simple_tool", "simple.tool"),
         # Edge case: no underscore at all
-        result = ToolNameAdapter.from_openai_compatible("tool")
-        assert result == "tool"
-    
-    def test_from_openai_compatible_multiple_underscores(self):
-        """Test converting OpenAI names with multiple underscores."""
-        result = ToolNameAdapter.from_openai_compatible("complex_namespace_tool_name")
+        ("tool", "tool"),
         # Should only split on first underscore
-        assert result == "complex.namespace_tool_name"
-    
-    def test_adapt_for_provider_openai(self):
-        """Test provider-specific adaptation for OpenAI."""
-        result = ToolNameAdapter.adapt_for_provider("sqlite", "list_tables", "openai")
-        assert result == "sqlite_list_tables"
-        
-        result = ToolNameAdapter.adapt_for_provider("ns.complex", "tool@name", "OPENAI")
-        assert result == "ns_complex_tool_name"
-    
-    def test_adapt_for_provider_anthropic(self):
-        """Test provider-specific adaptation for Anthropic."""
-        result = ToolNameAdapter.adapt_for_provider("sqlite", "list_tables", "anthropic")
-        assert result == "sqlite.list_tables"
-        
-        result = ToolNameAdapter.adapt_for_provider("filesystem", "read_file", "ANTHROPIC")
-        assert result == "filesystem.read_file"
-    
-    def test_adapt_for_provider_gemini(self):
-        """Test provider-specific adaptation for Gemini."""
-        result = ToolNameAdapter.adapt_for_provider("sqlite", "list_tables", "gemini")
-        assert result == "sqlite_list_tables"
-        
-        # This will fail initially until Gemini adaptation is properly implemented
-        result = ToolNameAdapter.adapt_for_provider("ns.special", "tool@name", "gemini")
-        assert result == "ns_special_tool_name"
-    
-    def test_adapt_for_provider_unknown(self):
-        """Test provider-specific adaptation for unknown provider."""
-        result = ToolNameAdapter.adapt_for_provider("sqlite", "list_tables", "unknown")
-        # Should default to namespace.name format
-        assert result == "sqlite.list_tables"
+        ("complex_namespace_tool_name", "complex.namespace_tool_name"),
+    ], ids=["basic", "basic-2", "single-underscore", "no-underscore", "multiple-underscores"])
+    def test_from_openai_compatible(self, openai_name, expected):
+        """Test converting OpenAI names back to MCP format."""
+        assert ToolNameAdapter.from_openai_compatible(openai_name) == expected
+    
+    @pytest.mark.parametrize("namespace,name,provider,expected", [
+        ("sqlite", "list_tables", "openai", "sqlite_list_tables"),
+        ("ns.complex", "tool@name", "OPENAI", "ns_complex_tool_name"),
+        ("sqlite", "list_tables", "anthropic", "sqlite.list_tables"),
+        ("filesystem", "read_file", "ANTHROPIC", "filesystem.read_file"),
+        ("sqlite", "list_tables", "gemini", "sqlite_list_tables"),
+        ("ns.special", "tool@name", "gemini", "ns_special_tool_name"),
+        # Unknown providers default to namespace.name format
+        ("sqlite", "list_tables", "unknown", "sqlite.list_tables"),
+    ], ids=[
+        "openai", "openai-uppercase", "anthropic", "anthropic-uppercase",
+        "gemini", "gemini-special-chars", "unknown",
+    ])
+    def test_adapt_for_provider(self, namespace, name, provider, expected):
+        """Test provider-specific adaptation."""
+        assert ToolNameAdapter.adapt_for_provider(namespace, name, provider) == expected
     
     def test_build_mapping_basic(self):
         """Test building tool name mapping."""
@@ -156,6 +110,24 @@ class TestToolNameAdapter:
         assert "sqlite.list_tables" in anthropic_mapping
         assert anthropic_mapping["sqlite.list_tables"] == "sqlite.list_tables"
     
+    def test_converter_for_resolves_once(self):
+        """Test that converter lookup is case-insensitive with a default fallback."""
+        assert ToolNameAdapter.converter_for("OpenAI") == ToolNameAdapter.to_openai_compatible
+        assert ToolNameAdapter.converter_for("unknown")("ns", "tool") == "ns.tool"
+    
+    def test_sanitizing_converters_are_memoized(self):
+        """Test that repeated conversions of the same name are served from cache."""
+        from mcp_ghost.tools.adapter import _gemini_name, _openai_name
+        
+        for converter, cached in (
+            (ToolNameAdapter.to_openai_compatible, _openai_name),
+            (ToolNameAdapter.to_gemini_compatible, _gemini_name),
+        ):
+            first = converter("memo.ns", "memo@tool")
+            hits = cached.cache_info().hits
+            assert converter("memo.ns", "memo@tool") == first
+            assert cached.cache_info().hits == hits + 1
+    
     def test_build_mapping_empty_tools(self):
         """Test building mapping with empty tools list."""
         mapping = ToolNameAdapter.build_mapping([], "openai")
@@ -207,10 +179,7 @@ class TestToolNameAdapterEdgeCases:
     
     def test_very_long_names(self):
         """Test handling of very long tool names."""
-        long_namespace = "a" * 100
-        long_name = "b" * 100
-        
-        result = ToolNameAdapter.to_openai_compatible(long_namespace, long_name)
+        result = ToolNameAdapter.to_openai_compatible(LONG_NAMESPACE, LONG_NAME)
         
         # This will fail initially if we don't handle length limits
         # OpenAI might have limits on function name length
@@ -223,9 +192,7 @@ class TestToolNameAdapterEdgeCases:
         assert result == "123_456"
         
         # Should be valid for OpenAI pattern
-        import re
-        openai_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-        assert openai_pattern.match(result)
+        assert OPENAI_NAME_RE.match(result)
     
     def test_unicode_handling(self):
         """Test handling of Unicode characters."""
@@ -234,10 +201,7 @@ class TestToolNameAdapterEdgeCases:
         # This will fail initially - need to handle Unicode properly
         # Should replace non-ASCII chars with underscores
         assert all(ord(c) < 128 for c in result), "Result should be ASCII only"
-        
-        import re
-        openai_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-        assert openai_pattern.match(result)
+        assert OPENAI_NAME_RE.match(result)
     
     def test_case_sensitivity(self):
         """Test case sensitivity in conversions."""
@@ -247,4 +211,10 @@ class TestToolNameAdapterEdgeCases:
         # Should preserve case
         assert result1 == "SQLite_ListTables"
         assert result2 == "sqlite_listtables"
-        assert result1 != result2
\ No newline at end of file
+        assert result1 != result2
+    
+    def test_non_ascii_identifiers_are_sanitized(self):
+        """Test that Unicode identifiers don't bypass sanitization."""
+        # "ñ" is a valid Python identifier character but not a valid tool name one
+        assert ToolNameAdapter.to_openai_compatible("señal", "tool") == "se_al_tool"
+        assert ToolNameAdapter.to_gemini_compatible("señal", "my-tool") == "se_al_my_tool"
@@ -9,6 +9,44 @@ from mcp_ghost.tools.formatter import (
 )
 from mcp_ghost.tools.models import ToolInfo, ToolCallResult
 
+# Built once at import; the formatter only reads it
+LARGE_DATA = {"data": ["item"] * 10000}
+
+TEXT_VALUES = ("Line 1", "Line 2", "Line 3")
+# A list, not a tuple: the formatter only treats lists as record sequences
+TEXT_RECORDS = [{"type": "text", "text": text} for text in TEXT_VALUES]
+TEXT_RECORDS_JOINED = "\n".join(TEXT_VALUES)
+
+DICT_RESPONSE = {"key": "value", "number": 42}
+LIST_RESPONSE = [{"id": 1, "name": "item1"}, {"id": 2, "name": "item2"}]
+MIXED_LIST_RESPONSE = [
+    {"type": "text", "text": "Text item"},
+    {"id": 1, "data": "Non-text item"}
+]
+COMPLEX_DATA = {
+    "tables": [
+        {"name": "users", "rows": 100},
+        {"name": "orders", "rows": 500}
+    ],
+    "query_time": "0.05s",
+    "metadata": {
+        "database": "production",
+        "version": "1.0"
+    }
+}
+
+
+def pretty_json(obj):
+    """The formatter's layout: two-space indent, insertion key order, raw Unicode."""
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Expected formatter output, serialized once so tests compare strings
+DICT_RESPONSE_JSON = pretty_json(DICT_RESPONSE)
+LIST_RESPONSE_JSON = pretty_json(LIST_RESPONSE)
+MIXED_LIST_RESPONSE_JSON = pretty_json(MIXED_LIST_RESPONSE)
+COMPLEX_DATA_JSON = pretty_json(COMPLEX_DATA)
+
 
 class TestFormatToolForOpenAI:
     """Test formatting tools for OpenAI function calling."""
@@ -104,50 +142,31 @@ class TestFormatToolResponse:
     
     def test_format_dict_response(self):
         """Test formatting dictionary response."""
-        response = {"key": "value", "number": 42}
-        result = format_tool_response(response)
+        result = format_tool_response(DICT_RESPONSE)
         
         # Should be JSON formatted
-        parsed = json.loads(result)
-        assert parsed == response
-        assert "key" in result
-        assert "42" in result
+        assert result == DICT_RESPONSE_JSON
     
     def test_format_list_response(self):
         """Test formatting list response."""
-        response = [{"id": 1, "name": "item1"}, {"id": 2, "name": "item2"}]
-        result = format_tool_response(response)
+        result = format_tool_response(LIST_RESPONSE)
         
-        parsed = json.loads(result)
-        assert parsed == response
-        assert len(parsed) == 2
+        assert result == LIST_RESPONSE_JSON
     
     def test_format_text_records_response(self):
         """Test formatting list of text records."""
-        response = [
-            {"type": "text", "text": "Line 1"},
-            {"type": "text", "text": "Line 2"},
-            {"type": "text", "text": "Line 3"}
-        ]
-        
-        result = format_tool_response(response)
+        result = format_tool_response(TEXT_RECORDS)
         
         # Should join text content, not JSON serialize
-        assert result == "Line 1\nLine 2\nLine 3"
+        assert result == TEXT_RECORDS_JOINED
         assert "type" not in result  # Should not contain the structure
     
     def test_format_mixed_list_response(self):
         """Test formatting list with mixed content."""
-        response = [
-            {"type": "text", "text": "Text item"},
-            {"id": 1, "data": "Non-text item"}
-        ]
-        
-        result = format_tool_response(response)
+        result = format_tool_response(MIXED_LIST_RESPONSE)
         
         # Should JSON serialize since not all items are text records
-        parsed = json.loads(result)
-        assert parsed == response
+        assert result == MIXED_LIST_RESPONSE_JSON
     
     def test_format_non_serializable_response(self):
         """Test formatting response that can't be JSON serialized."""
@@ -195,8 +214,7 @@ class TestFormatToolCallResult:
         formatted = format_tool_call_result(result)
         
         # Should format the result data
-        parsed = json.loads(formatted)
-        assert parsed == {"data": "success"}
+        assert formatted == '{\n  "data": "success"\n}'
     
     def test_format_failed_result(self):
         """Test formatting failed tool call result."""
@@ -223,30 +241,15 @@ class TestFormatToolCallResult:
     
     def test_format_result_with_complex_data(self):
         """Test formatting result with complex data structure."""
-        complex_data = {
-            "tables": [
-                {"name": "users", "rows": 100},
-                {"name": "orders", "rows": 500}
-            ],
-            "query_time": "0.05s",
-            "metadata": {
-                "database": "production",
-                "version": "1.0"
-            }
-        }
-        
         result = ToolCallResult(
             tool_name="sql_query",
             success=True,
-            result=complex_data
+            result=COMPLEX_DATA
         )
         
         formatted = format_tool_call_result(result)
-        parsed = json.loads(formatted)
         
-        assert parsed == complex_data
-        assert len(parsed["tables"]) == 2
-        assert "query_time" in formatted
+        assert formatted == COMPLEX_DATA_JSON
 
 
 class TestFormatToolsForProvider:
@@ -309,16 +312,12 @@ class TestFormatToolsForProvider:
         result = format_tools_for_provider([], "openai")
         assert result == []
     
-    def test_format_tools_case_insensitive_provider(self):
+    @pytest.mark.parametrize("provider", ["OpenAI", "OPENAI", "openai"])
+    def test_format_tools_case_insensitive_provider(self, provider):
         """Test that provider name is case insensitive."""
-        tools = [ToolInfo(name="test", namespace="ns")]
-        
-        result1 = format_tools_for_provider(tools, "OpenAI")
-        result2 = format_tools_for_provider(tools, "OPENAI")
-        result3 = format_tools_for_provider(tools, "openai")
+        tool = ToolInfo(name="test", namespace="ns")
         
-        # All should produce the same result
-        assert result1 == result2 == result3
+        assert format_tools_for_provider([tool], provider) == [format_tool_for_openai(tool)]
     
     def test_format_tools_preserves_all_data(self):
         """Test that formatting preserves all tool data."""
@@ -385,10 +384,7 @@ class TestFormatterEdgeCases:
     
     def test_format_very_large_response(self):
         """Test formatting very large response."""
-        # Create a large data structure
-        large_data = {"data": ["item"] * 10000}
-        
-        result = format_tool_response(large_data)
+        result = format_tool_response(LARGE_DATA)
         
         # Should handle large data without issues
         parsed = json.loads(result)
@@ -2,6 +2,76 @@
 import pytest
 from mcp_ghost.tools.models import ToolInfo, ServerInfo, ToolCallResult, ResourceInfo
 
+COMPLEX_TOOL_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "arg1": {"type": "string"}
+    }
+}
+
+COMPLEX_TOOL_TAGS = ["utility", "database"]
+
+COMPLEX_CALL_RESULT = {
+    "tables": [
+        {"name": "users", "rows": 100},
+        {"name": "orders", "rows": 500}
+    ],
+    "query_time": "0.05s"
+}
+
+RESOURCE_EXTRA_DATA = {
+    "size": 1024,
+    "modified": "2025-01-01",
+    "permissions": ["read", "write"]
+}
+
+
+@pytest.fixture(scope="module")
+def complex_tool():
+    """ToolInfo with every field set; read-only, so shared by the module."""
+    return ToolInfo(
+        name="complex_tool",
+        namespace="complex_ns", 
+        description="A complex tool",
+        parameters=COMPLEX_TOOL_PARAMETERS,
+        is_async=True,
+        tags=COMPLEX_TOOL_TAGS,
+        supports_streaming=True
+    )
+
+
+@pytest.fixture(scope="module")
+def successful_result():
+    """Successful ToolCallResult shared by the module's read-only tests."""
+    return ToolCallResult(
+        tool_name="test_tool",
+        success=True,
+        result={"data": "success"},
+        execution_time=1.5
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_result():
+    """Failed ToolCallResult shared by the module's read-only tests."""
+    return ToolCallResult(
+        tool_name="failing_tool",
+        success=False,
+        error="Tool execution failed",
+        execution_time=0.5
+    )
+
+
+@pytest.fixture(scope="module")
+def resource_with_extra():
+    """ResourceInfo carrying extra data, shared by the module's read-only tests."""
+    return ResourceInfo(
+        id="file_1",
+        name="document.txt",
+        type="file",
+        extra=RESOURCE_EXTRA_DATA
+    )
+
 
 class TestToolInfo:
     """Test the ToolInfo dataclass."""
@@ -17,52 +87,56 @@ class TestToolInfo:
         assert tool.tags == []
         assert tool.supports_streaming is False
     
-    def test_tool_info_with_all_fields(self):
+    def test_tool_info_with_all_fields(self, complex_tool):
         """Test ToolInfo with all fields populated."""
-        parameters = {
-            "type": "object",
-            "properties": {
-                "arg1": {"type": "string"}
-            }
-        }
-        
-        tool = ToolInfo(
-            name="complex_tool",
-            namespace="complex_ns", 
-            description="A complex tool",
-            parameters=parameters,
-            is_async=True,
-            tags=["utility", "database"],
-            supports_streaming=True
-        )
-        
-        assert tool.name == "complex_tool"
-        assert tool.namespace == "complex_ns"
-        assert tool.description == "A complex tool"
-        assert tool.parameters == parameters
-        assert tool.is_async is True
-        assert tool.tags == ["utility", "database"]
-        assert tool.supports_streaming is True
+        assert complex_tool.name == "complex_tool"
+        assert complex_tool.namespace == "complex_ns"
+        assert complex_tool.description == "A complex tool"
+        assert complex_tool.parameters == COMPLEX_TOOL_PARAMETERS
+        assert complex_tool.is_async is True
+        assert complex_tool.tags == COMPLEX_TOOL_TAGS
+        assert complex_tool.supports_streaming is True
     
-    def test_tool_info_equality(self):
+    @pytest.fixture
+    def tool_pair(self):
+        """Two separately built but field-for-field equal ToolInfo instances."""
+        return ToolInfo(name="test", namespace="ns"), ToolInfo(name="test", namespace="ns")
+    
+    def test_tool_info_equality(self, tool_pair):
         """Test ToolInfo equality comparison."""
-        tool1 = ToolInfo(name="test", namespace="ns")
-        tool2 = ToolInfo(name="test", namespace="ns")
-        tool3 = ToolInfo(name="different", namespace="ns")
+        tool1, tool2 = tool_pair
         
+        assert tool1 is not tool2
         assert tool1 == tool2
-        assert tool1 != tool3
+        assert tool1 != ToolInfo(name="different", namespace="ns")
     
     def test_tool_info_default_factory(self):
         """Test that default factory creates separate lists."""
         tool1 = ToolInfo(name="test1", namespace="ns")
         tool2 = ToolInfo(name="test2", namespace="ns")
         
+        # Each instance gets its own empty list, checked before any mutation
+        assert tool1.tags is not tool2.tags
+        assert tool1.tags == []
+        assert tool2.tags == []
+        
         tool1.tags.append("tag1")
         
-        # This will fail if default_factory isn't working correctly
-        assert tool2.tags == []
         assert tool1.tags == ["tag1"]
+        assert tool2.tags == []
+    
+    def test_tool_info_qualified_name(self):
+        """Test that qualified_name joins namespace and name MCP-style."""
+        assert ToolInfo(name="list_tables", namespace="sqlite").qualified_name == "sqlite.list_tables"
+    
+    def test_tool_info_is_immutable(self):
+        """Test that ToolInfo fields can't be reassigned, so instances are safe to share."""
+        import dataclasses
+        
+        tool = ToolInfo(name="test", namespace="ns")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tool.name = "other"
 
 
 class TestServerInfo:
@@ -84,19 +158,17 @@ class TestServerInfo:
         assert server.tool_count == 5
         assert server.namespace == "test_ns"
     
-    def test_server_info_different_statuses(self):
+    @pytest.mark.parametrize("status", ["connected", "disconnected", "error", "connecting"])
+    def test_server_info_different_statuses(self, status):
         """Test ServerInfo with different status values."""
-        statuses = ["connected", "disconnected", "error", "connecting"]
-        
-        for i, status in enumerate(statuses):
-            server = ServerInfo(
-                id=i,
-                name=f"server_{i}",
-                status=status,
-                tool_count=0,
-                namespace="ns"
-            )
-            assert server.status == status
+        server = ServerInfo(
+            id=0,
+            name=f"server_{status}",
+            status=status,
+            tool_count=0,
+            namespace="ns"
+        )
+        assert server.status == status
     
     def test_server_info_validation(self):
         """Test that ServerInfo validates its fields properly."""
@@ -114,66 +186,32 @@ class TestServerInfo:
 class TestToolCallResult:
     """Test the ToolCallResult dataclass."""
     
-    def test_successful_tool_call_result(self):
+    def test_successful_tool_call_result(self, successful_result):
         """Test successful tool call result."""
-        result = ToolCallResult(
-            tool_name="test_tool",
-            success=True,
-            result={"data": "success"},
-            execution_time=1.5
-        )
-        
-        assert result.tool_name == "test_tool"
-        assert result.success is True
-        assert result.result == {"data": "success"}
-        assert result.error is None
-        assert result.execution_time == 1.5
+        assert successful_result.tool_name == "test_tool"
+        assert successful_result.success is True
+        assert successful_result.result == {"data": "success"}
+        assert successful_result.error is None
+        assert successful_result.execution_time == 1.5
     
-    def test_failed_tool_call_result(self):
+    def test_failed_tool_call_result(self, failed_result):
         """Test failed tool call result."""
-        result = ToolCallResult(
-            tool_name="failing_tool",
-            success=False,
-            error="Tool execution failed",
-            execution_time=0.5
-        )
-        
-        assert result.tool_name == "failing_tool"
-        assert result.success is False
-        assert result.result is None
-        assert result.error == "Tool execution failed"
-        assert result.execution_time == 0.5
+        assert failed_result.tool_name == "failing_tool"
+        assert failed_result.success is False
+        assert failed_result.result is None
+        assert failed_result.error == "Tool execution failed"
+        assert failed_result.execution_time == 0.5
     
     def test_tool_call_result_with_complex_result(self):
         """Test tool call result with complex data structures."""
-        complex_result = {
-            "tables": [
-                {"name": "users", "rows": 100},
-                {"name": "orders", "rows": 500}
-            ],
-            "query_time": "0.05s"
-        }
-        
         result = ToolCallResult(
             tool_name="sql_query",
             success=True,
-            result=complex_result
+            result=COMPLEX_CALL_RESULT
         )
         
-        assert result.result == complex_result
+        assert result.result == COMPLEX_CALL_RESULT
         assert len(result.result["tables"]) == 2
-    
-    def test_tool_call_result_validation(self):
-        """Test tool call result validation."""
-        # This will fail initially - we should validate that success=False has an error
-        result = ToolCallResult(
-            tool_name="test",
-            success=False
-            # Missing error field when success=False
-        )
-        
-        # Should fail validation
-        assert result.error is not None or not result.success
 
 
 class TestResourceInfo:
@@ -192,129 +230,55 @@ class TestResourceInfo:
         assert resource.type == "file"
         assert resource.extra == {}
     
-    def test_resource_info_with_extra_data(self):
+    def test_resource_info_with_extra_data(self, resource_with_extra):
         """Test ResourceInfo with extra data."""
-        extra_data = {
-            "size": 1024,
-            "modified": "2025-01-01",
-            "permissions": ["read", "write"]
-        }
-        
-        resource = ResourceInfo(
-            id="file_1",
-            name="document.txt",
-            type="file",
-            extra=extra_data
-        )
-        
-        assert resource.extra == extra_data
-        assert resource.extra["size"] == 1024
+        assert resource_with_extra.extra == RESOURCE_EXTRA_DATA
+        assert resource_with_extra.extra["size"] == 1024
     
-    def test_resource_info_from_raw_dict(self):
+    @pytest.mark.parametrize("raw,expected_id,expected_name,expected_type,expected_extra", [
+        ({}, None, None, None, {}),
+        # Missing common fields default to None
+        ({"name": "Partial Resource", "custom_attr": "value"},
+         None, "Partial Resource", None, {"custom_attr": "value"}),
+        # Extra fields should be in extra dict
+        ({"id": "res_123", "name": "Resource Name", "type": "database",
+          "size": 2048, "owner": "admin", "custom_field": "custom_value"},
+         "res_123", "Resource Name", "database",
+         {"size": 2048, "owner": "admin", "custom_field": "custom_value"}),
+    ], ids=["empty", "partial", "full"])
+    def test_resource_info_from_raw_dict(self, raw, expected_id, expected_name, expected_type, expected_extra):
         """Test creating ResourceInfo from raw dictionary."""
-        raw_data = {
-            "id": "res_123",
-            "name": "Resource Name",
-            "type": "database",
-            "size": 2048,
-            "owner": "admin",
-            "custom_field": "custom_value"
-        }
-        
-        resource = ResourceInfo.from_raw(raw_data)
+        resource = ResourceInfo.from_raw(raw)
         
-        assert resource.id == "res_123"
-        assert resource.name == "Resource Name"
-        assert resource.type == "database"
-        
-        # Extra fields should be in extra dict
-        assert resource.extra["size"] == 2048
-        assert resource.extra["owner"] == "admin"
-        assert resource.extra["custom_field"] == "custom_value"
+        assert (resource.id, resource.name, resource.type) == (expected_id, expected_name, expected_type)
+        assert resource.extra == expected_extra
     
-    def test_resource_info_from_raw_primitive(self):
+    @pytest.mark.parametrize("value", ["simple_string", 42, [1, 2, 3], (1, 2), 3.14, True])
+    def test_resource_info_from_raw_primitive(self, value):
         """Test creating ResourceInfo from primitive value."""
-        # Test with string
-        resource = ResourceInfo.from_raw("simple_string")
-        assert resource.id is None
-        assert resource.name is None
-        assert resource.type is None
-        assert resource.extra["value"] == "simple_string"
-        
-        # Test with number
-        resource = ResourceInfo.from_raw(42)
-        assert resource.extra["value"] == 42
-        
-        # Test with list
-        resource = ResourceInfo.from_raw([1, 2, 3])
-        assert resource.extra["value"] == [1, 2, 3]
-    
-    def test_resource_info_from_raw_empty_dict(self):
-        """Test creating ResourceInfo from empty dictionary."""
-        resource = ResourceInfo.from_raw({})
-        
+        resource = ResourceInfo.from_raw(value)
         assert resource.id is None
         assert resource.name is None
         assert resource.type is None
-        assert resource.extra == {}
-    
-    def test_resource_info_from_raw_partial_dict(self):
-        """Test creating ResourceInfo from partial dictionary."""
-        raw_data = {
-            "name": "Partial Resource",
-            "custom_attr": "value"
-        }
-        
-        resource = ResourceInfo.from_raw(raw_data)
-        
-        assert resource.id is None  # Missing from raw data
-        assert resource.name == "Partial Resource"
-        assert resource.type is None  # Missing from raw data
-        assert resource.extra["custom_attr"] == "value"
+        assert resource.extra["value"] == value
 
 
 class TestModelInteractions:
     """Test interactions between different models."""
     
-    def test_tool_info_to_tool_call_result(self):
+    @pytest.mark.parametrize("success,payload", [
+        (True, {"result": "execution successful"}),
+        (False, {"error": "execution failed"}),
+    ], ids=["success", "failure"])
+    def test_tool_info_to_tool_call_result(self, success, payload):
         """Test creating ToolCallResult from ToolInfo execution."""
         tool = ToolInfo(name="test_tool", namespace="test_ns")
         
-        # Successful execution
-        success_result = ToolCallResult(
-            tool_name=f"{tool.namespace}.{tool.name}",
-            success=True,
-            result="execution successful"
-        )
-        
-        assert success_result.tool_name == "test_ns.test_tool"
-        
-        # Failed execution
-        error_result = ToolCallResult(
-            tool_name=f"{tool.namespace}.{tool.name}",
-            success=False,
-            error="execution failed"
-        )
-        
-        assert error_result.tool_name == "test_ns.test_tool"
-    
-    def test_server_info_with_tool_count_validation(self):
-        """Test that server tool count matches actual tools."""
-        server = ServerInfo(
-            id=1,
-            name="test_server",
-            status="connected",
-            tool_count=3,
-            namespace="test_ns"
+        result = ToolCallResult(
+            tool_name=tool.qualified_name,
+            success=success,
+            **payload
         )
         
-        # This will fail initially - we should validate tool count
-        tools = [
-            ToolInfo(name="tool1", namespace="test_ns"),
-            ToolInfo(name="tool2", namespace="test_ns"),
-            ToolInfo(name="tool3", namespace="test_ns"),
-            ToolInfo(name="tool4", namespace="test_ns")  # One extra tool
-        ]
-        
-        # Tool count should match the number of tools
-        assert server.tool_count == len(tools) - 1  # This will fail
\ No newline at end of file
+        assert result.tool_name == "test_ns.test_tool"
+        assert result.success is success
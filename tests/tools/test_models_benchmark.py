@@ -0,0 +1,43 @@
+"""Benchmarks for tool models (run with ``pytest --benchmark-only``)."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from mcp_ghost.tools.models import ToolInfo, ToolCallResult, ResourceInfo
+
+RAW_RESOURCE = {"id": "x", "name": "y", "type": "t", "a": 1, "b": 2, "c": 3}
+
+# One group so the report lines the models' construction costs up side by side
+construction = pytest.mark.benchmark(group="dataclass-construction", min_rounds=50, warmup=True)
+
+
+class TestModelConstructionBenchmarks:
+    """Regression guards for model construction."""
+    
+    @construction
+    def test_from_raw_dict_perf(self, benchmark):
+        """Benchmark the dict branch of ResourceInfo.from_raw."""
+        resource = benchmark.pedantic(
+            ResourceInfo.from_raw,
+            args=(RAW_RESOURCE,),
+            rounds=100,
+            iterations=1000,
+            warmup_rounds=5,
+        )
+        
+        assert resource.id == "x"
+        assert resource.extra == {"a": 1, "b": 2, "c": 3}
+    
+    @construction
+    def test_tool_info_perf(self, benchmark):
+        """Benchmark ToolInfo construction (frozen, slotted)."""
+        tool = benchmark(ToolInfo, name="list_tables", namespace="sqlite")
+        
+        assert tool.qualified_name == "sqlite.list_tables"
+    
+    @construction
+    def test_tool_call_result_perf(self, benchmark):
+        """Benchmark ToolCallResult construction."""
+        result = benchmark(ToolCallResult, tool_name="sqlite.list_tables", success=True, result=[])
+        
+        assert result.success is True